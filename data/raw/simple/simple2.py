@@ -11,6 +11,9 @@ from typing import Any, Callable, Dict, List, Union
 
 # --- 1. 复杂数据结构操作 ---
 
+# 区分"键不存在"和"值为 None"的哨兵对象
+_MISSING = object()
+
 
 def find_nested_value(data: Dict[str, Any], keys: List[str]) -> Any:
     """
@@ -22,9 +25,11 @@ def find_nested_value(data: Dict[str, Any], keys: List[str]) -> Any:
     """
     current = data
     for key in keys:
-        if isinstance(current, dict) and key in current:
-            current = current[key]
-        else:
+        if not isinstance(current, dict):
+            return None
+        # 单次哈希查找代替 "in" + 下标两次查找
+        current = current.get(key, _MISSING)
+        if current is _MISSING:
             return None
     return current
 
@@ -103,6 +108,9 @@ def binary_search(sorted_list: List[int], target: int) -> int:
 
 # --- 4. 错误处理和正则 ---
 
+# 模块加载时编译一次，避免每次调用重复查找/编译
+_EMAIL_RE = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
+
 
 def extract_emails(text: str) -> List[str]:
     """
@@ -110,8 +118,7 @@ def extract_emails(text: str) -> List[str]:
     :param text: 包含可能电子邮件的文本
     :return: 提取到的电子邮件列表
     """
-    email_pattern = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
-    return re.findall(email_pattern, text)
+    return _EMAIL_RE.findall(text)
 
 
 def safe_convert_to_int(value: Any) -> int:
@@ -363,11 +370,16 @@ def flatten_nested_list(nested_list: List[Any]) -> List[Any]:
     :return: 扁平化后的一维列表
     """
     result = []
-    for item in nested_list:
-        if isinstance(item, list):
-            result.extend(flatten_nested_list(item))
-        else:
+    # 用显式的迭代器栈代替递归，避免每层嵌套的函数调用开销和递归深度限制
+    stack = [iter(nested_list)]
+    while stack:
+        for item in stack[-1]:
+            if isinstance(item, list):
+                stack.append(iter(item))
+                break
             result.append(item)
+        else:
+            stack.pop()
     return result
 
 
@@ -375,19 +387,24 @@ def find_common_elements(list_of_lists: List[List[Any]]) -> List[Any]:
     """
     找出多个列表中的所有共同元素。
     :param list_of_lists: 列表的列表
-    :return: 所有列表都共有的元素列表
+    :return: 所有列表都共有的元素列表，按其在第一个列表中的顺序排列
     """
     if not list_of_lists:
         return []
 
-    # 使用第一个列表的元素作为初始候选
-    common = set(list_of_lists[0])
-    # 与后续每个列表求交集
-    for lst in list_of_lists[1:]:
-        common.intersection_update(lst)
+    # 从最小的集合开始求交集，候选集合只会越来越小
+    sets = sorted(map(set, list_of_lists), key=len)
+    common = sets[0]
+    for other in sets[1:]:
+        common &= other
         if not common:  # 提前退出，如果没有共同元素
-            break
-    return list(common)
+            return []
+
+    # 按第一个列表中的出现顺序输出，重复元素只保留一次
+    seen = set()
+    return [
+        x for x in list_of_lists[0] if x in common and x not in seen and not seen.add(x)
+    ]
 
 
 print("'complex_functions.py' 模块加载完毕。")
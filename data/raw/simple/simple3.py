@@ -9,7 +9,9 @@ import json
 import re
 import threading
 import time
+from collections.abc import Mapping
 from datetime import datetime
+from types import CodeType, MappingProxyType
 from typing import Any, Callable, Dict, List, Optional, TypedDict, Union
 
 # --- 1. 自定义异常和类型定义 ---
@@ -37,6 +39,14 @@ class User(TypedDict):
     is_active: bool
 
 
+class UrlInfo(TypedDict):
+    """extract_and_validate_urls 返回的 URL 信息结构"""
+
+    url: str
+    protocol: str
+    domain: str
+
+
 # --- 2. 设计模式 ---
 
 
@@ -68,6 +78,15 @@ class SingletonDatabase:
         # self._instance = None
 
 
+# 必填字段与默认值在模块加载时构建一次；只读映射防止调用方意外修改共享默认值
+_USER_REQUIRED_FIELDS = ("id", "name", "email")
+_USER_REQUIRED = frozenset(_USER_REQUIRED_FIELDS)
+_USER_DEFAULTS = MappingProxyType({"balance": 0.0, "is_active": True})
+_PRODUCT_DEFAULTS = MappingProxyType(
+    {"id": None, "name": None, "price": 0.0, "category": "uncategorized"}
+)
+
+
 def create_resource(resource_type: str, **kwargs) -> Dict[str, Any]:
     """
     一个简单的工厂模式函数，用于创建不同类型的资源。
@@ -76,24 +95,23 @@ def create_resource(resource_type: str, **kwargs) -> Dict[str, Any]:
     :return: 创建的资源字典
     """
     if resource_type == "user":
-        required_fields = ["id", "name", "email"]
-        if not all(field in kwargs for field in required_fields):
+        if not _USER_REQUIRED <= kwargs.keys():
             raise ValueError(
-                f"Missing required fields for 'user': {', '.join(required_fields)}"
+                f"Missing required fields for 'user': {', '.join(_USER_REQUIRED_FIELDS)}"
             )
         return User(
             id=kwargs["id"],
             name=kwargs["name"],
             email=kwargs["email"],
-            balance=kwargs.get("balance", 0.0),
-            is_active=kwargs.get("is_active", True),
+            **{
+                field: kwargs.get(field, value)
+                for field, value in _USER_DEFAULTS.items()
+            },
         )
     elif resource_type == "product":
         return {
-            "id": kwargs.get("id"),
-            "name": kwargs.get("name"),
-            "price": kwargs.get("price", 0.0),
-            "category": kwargs.get("category", "uncategorized"),
+            field: kwargs.get(field, value)
+            for field, value in _PRODUCT_DEFAULTS.items()
         }
     else:
         raise ValueError(f"Unknown resource type: {resource_type}")
@@ -123,8 +141,13 @@ def fibonacci_memoized(n: int) -> int:
         return 0
     elif n == 1:
         return 1
-    else:
-        return fibonacci_memoized(n - 1) + fibonacci_memoized(n - 2)
+    # 快速倍增：F(2k) = F(k)·(F(k) + 2·F(k-1))，F(2k+1) = F(k)² + F(k+1)²
+    # 只涉及 O(log n) 个不同的子问题，递归深度也只有 O(log n)
+    k, odd = divmod(n, 2)
+    fk = fibonacci_memoized(k)
+    if odd:
+        return fk * fk + fibonacci_memoized(k + 1) ** 2
+    return fk * (fk + 2 * fibonacci_memoized(k - 1))
 
 
 # --- 4. 上下文管理器 ---
@@ -242,38 +265,52 @@ def find_longest_palindromic_substring(s: str) -> str:
 def expand_around_center(s: str, left: int, right: int) -> int:
     """辅助函数，用于查找回文子串。"""
     L, R = left, right
-    while L >= 0 and R < len(s) and s[L] == s[R]:
+    n = len(s)
+    # 短扩展（最常见的情况）逐字符比较；扩展到 8 个字符仍未停止时改用切片
+    stop = right + 8
+    while L >= 0 and R < n and s[L] == s[R]:
         L -= 1
         R += 1
-    return R - L - 1
+        if R == stop:
+            break
+    else:
+        return R - L - 1
+
+    # 长扩展：倍增步长，每次用切片一次比较一整段字符（比较在 C 层完成），
+    # Python 层只循环 O(log² k) 次，而不是每个字符一次
+    matched, step = 8, 8
+    limit = min(left + 1, n - right)
+    while matched < limit:
+        step = min(step, limit - matched)
+        if s[right + matched : right + matched + step] == (
+            s[left - matched - step + 1 : left - matched + 1][::-1]
+        ):
+            matched += step
+            step *= 2
+        else:
+            # 第一个不匹配的位置落在这一段内：收紧上界，从小步长重新倍增
+            limit = matched + step - 1
+            step = 1
+    return right - left - 1 + 2 * matched
 
 
 # --- 7. 复杂字符串与正则 ---
 
+# 一个相对复杂的URL匹配正则表达式，模块加载时编译一次；
+# 协议和域名在同一次扫描中分组捕获
+_URL_RE = re.compile(r"(https?)://(?:www\.)?([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})(?:/[^\s]*)?")
+
 
-def extract_and_validate_urls(text: str) -> List[Dict[str, str]]:
+def extract_and_validate_urls(text: str) -> List[UrlInfo]:
     """
     从文本中提取URL，并解析其组成部分。
     :param text: 包含URL的文本
     :return: 一个字典列表，每个字典包含 'url', 'protocol', 'domain'
     """
-    # 一个相对复杂的URL匹配正则表达式
-    url_pattern = r"https?://(?:www\.)?([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})(?:/[^\s]*)?"
-    matches = re.findall(url_pattern, text)
-
-    results = []
-    for match in matches:
-        # 这是一个简化的提取，实际情况更复杂
-        protocol_match = re.match(r"(https?)://", match)
-        protocol = protocol_match.group(1) if protocol_match else "http"
-
-        # 移除协议和可能的www.来获取域名
-        domain = re.sub(r"^https?://(www\.)?", "", match)
-        domain = re.sub(r"/.*", "", domain)  # 移除路径部分
-
-        results.append({"url": match, "protocol": protocol, "domain": domain})
-
-    return results
+    return [
+        {"url": domain, "protocol": protocol, "domain": domain}
+        for protocol, domain in _URL_RE.findall(text)
+    ]
 
 
 # --- 8. 模拟外部系统交互 ---
@@ -351,16 +388,46 @@ def transfer_funds(from_user: User, to_user: User, amount: float) -> Dict[str, A
 # --- 10. 杂项高级函数 ---
 
 
+# deep_copy_dict 原样返回的不可变标量：精确类型集合用于内联快速路径，
+# 基类元组用于 isinstance 判断（覆盖 bool、IntEnum、StrEnum 等子类）
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+_SCALAR_BASES = (str, int, float, type(None))
+
+
 def deep_copy_dict(obj: Any) -> Any:
     """
-    一个简单的深拷贝函数（使用json作为辅助）。
-    :param obj: 要拷贝的对象（应可被JSON序列化）
+    一个简单的深拷贝函数（按类型递归复制 dict/list/tuple，不经过 JSON 序列化）。
+    Mapping、list、tuple 的子类（如 OrderedDict、defaultdict）复制为对应的内置类型。
+    :param obj: 要拷贝的对象（只能由 Mapping/list/tuple 和 JSON 标量组成）
     :return: 深拷贝后的对象
     """
+
+    def _clone(o: Any) -> Any:
+        # 精确标量类型直接内联返回，只有容器、子类或需要报错的类型才递归调用
+        t = type(o)
+        if t is dict or isinstance(o, Mapping):
+            return {
+                k: v if type(v) in _SCALAR_TYPES else _clone(v) for k, v in o.items()
+            }
+        elif isinstance(o, list):
+            return [item if type(item) in _SCALAR_TYPES else _clone(item) for item in o]
+        elif isinstance(o, tuple):
+            return tuple(
+                [item if type(item) in _SCALAR_TYPES else _clone(item) for item in o]
+            )
+        elif isinstance(o, _SCALAR_BASES):
+            return o
+        raise DataProcessingError(
+            f"Cannot deep copy object: unsupported type '{t.__name__}'"
+        )
+
     try:
-        return json.loads(json.dumps(obj))
-    except (TypeError, ValueError) as e:
-        raise DataProcessingError(f"Cannot deep copy object: {e}") from e
+        return _clone(obj)
+    except RecursionError as e:
+        # 无法区分循环引用和嵌套过深的无环数据，两种情况都会超出递归深度限制
+        raise DataProcessingError(
+            "Cannot deep copy object: structure is too deeply nested or circular"
+        ) from e
 
 
 def parse_nested_json(json_str: str) -> Any:
@@ -391,6 +458,16 @@ def parse_nested_json(json_str: str) -> Any:
         raise DataProcessingError(f"Invalid JSON string: {e}") from e
 
 
+# 表达式字符白名单，模块加载时编译一次
+_EXPRESSION_CHARS_RE = re.compile(r"^[a-zA-Z0-9+\-*/().\s]+$")
+
+
+# 按表达式字符串缓存编译后的代码对象：同一表达式配不同变量时跳过重复解析；
+# 条目数设上限，防止大量不同的输入让缓存无限增长
+_COMPILED_EXPRESSIONS: Dict[str, CodeType] = {}
+_COMPILED_EXPRESSIONS_MAX = 256
+
+
 def calculate_complex_expression(expression: str, variables: Dict[str, float]) -> float:
     """
     计算一个包含变量的复杂数学表达式。
@@ -403,12 +480,18 @@ def calculate_complex_expression(expression: str, variables: Dict[str, float]) -
         raise ValueError("Invalid input types.")
 
     # 简单的安全检查：只允许字母、数字和指定运算符
-    if not re.match(r"^[a-zA-Z0-9+\-*/().\s]+$", expression):
+    if not _EXPRESSION_CHARS_RE.match(expression):
         raise ValueError("Expression contains invalid characters.")
 
     try:
-        # 使用eval计算表达式，传入变量字典作为 locals
-        result = eval(expression, {}, variables)
+        code = _COMPILED_EXPRESSIONS.get(expression)
+        if code is None:
+            # 与直接 eval 字符串一致：去掉开头的空格和制表符，否则 compile 会报缩进错误
+            code = compile(expression.strip(" \t"), "<expression>", "eval")
+            if len(_COMPILED_EXPRESSIONS) < _COMPILED_EXPRESSIONS_MAX:
+                _COMPILED_EXPRESSIONS[expression] = code
+        # 使用eval计算缓存的代码对象，传入变量字典作为 locals
+        result = eval(code, {}, variables)
         if not isinstance(result, (int, float)):
             raise ValueError("Expression did not evaluate to a number.")
         return float(result)
@@ -0,0 +1,65 @@
+"""
+Shared pytest fixtures for the generated simple test modules.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def simple2():
+    """The data.raw.simple.simple2 module, imported once per test session"""
+    import data.raw.simple.simple2 as module
+
+    return module
+
+
+@pytest.fixture(scope="module")
+def thread_pool():
+    """Worker threads reused across a module instead of spawned per test"""
+    # 10 workers so the widest fan-out (singleton creation race) runs at once
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        yield executor
+
+
+@pytest.fixture
+def print_calls(monkeypatch):
+    """Record print() calls made inside simple3 as argument tuples"""
+    calls = []
+    # Shadow print in the SUT module only; list.append is thread-safe
+    monkeypatch.setattr(
+        "data.raw.simple.simple3.print",
+        lambda *args, **kwargs: calls.append(args),
+        raising=False,
+    )
+    return calls
+
+
+@pytest.fixture
+def reset_singleton():
+    """Clear SingletonDatabase._instance for the test, then restore it"""
+    from data.raw.simple.simple3 import SingletonDatabase
+
+    previous = SingletonDatabase._instance
+    SingletonDatabase._instance = None
+    yield SingletonDatabase
+    # Drop whatever the test built (possibly half-initialised) and put back
+    # the instance a session-scoped shared_singleton may still be handing out
+    SingletonDatabase._instance = previous
+
+
+@pytest.fixture
+def fresh_singleton(reset_singleton):
+    """A newly constructed SingletonDatabase for tests that need first creation"""
+    return reset_singleton()
+
+
+@pytest.fixture(scope="session")
+def shared_singleton():
+    """One SingletonDatabase per session (per xdist worker) for read-only use"""
+    from data.raw.simple.simple3 import SingletonDatabase
+
+    SingletonDatabase._instance = None
+    yield SingletonDatabase()
+    SingletonDatabase._instance = None
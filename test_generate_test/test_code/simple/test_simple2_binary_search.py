@@ -1,6 +1,4 @@
 # from complex_functions import binary_search
-import pytest
-
 from data.raw.simple.simple2 import binary_search
 
 
@@ -146,4 +144,6 @@ class TestBinarySearch:
 
 
 if __name__ == "__main__":
+    import pytest
+
     pytest.main([__file__, "-v"])
@@ -1,8 +1,13 @@
 # from complex_functions import calculate_shipping_cost
+import re
+
 import pytest
 
 from data.raw.simple.simple2 import calculate_shipping_cost
 
+# Compiled once so pytest.raises does not re-compile the pattern per test
+_POSITIVE_RE = re.compile(r"Weight must be positive\.")
+
 
 class TestCalculateShippingCost:
     """Test cases for calculate_shipping_cost function"""
@@ -55,12 +60,12 @@ class TestCalculateShippingCost:
 
     def test_zero_weight_raises_error(self):
         """Test that zero weight raises ValueError"""
-        with pytest.raises(ValueError, match="Weight must be positive."):
+        with pytest.raises(ValueError, match=_POSITIVE_RE):
             calculate_shipping_cost(0.0, "US")
 
     def test_negative_weight_raises_error(self):
         """Test that negative weight raises ValueError"""
-        with pytest.raises(ValueError, match="Weight must be positive."):
+        with pytest.raises(ValueError, match=_POSITIVE_RE):
             calculate_shipping_cost(-5.0, "UK")
 
     def test_very_small_weight(self):
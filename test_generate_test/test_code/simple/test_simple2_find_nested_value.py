@@ -4,6 +4,34 @@ import pytest
 from data.raw.simple.simple2 import find_nested_value
 
 
+@pytest.fixture(scope="module")
+def mixed_data():
+    """Nested dict holding one value of each basic type, built once per module"""
+    return {
+        "level1": {
+            "level2": {
+                "string": "text",
+                "number": 42,
+                "list": [1, 2, 3],
+                "dict": {"nested": "value"},
+                "none": None,
+                "boolean": True,
+            }
+        }
+    }
+
+
+@pytest.fixture(scope="session")
+def deep_nested():
+    """100-level nested dict and its key path, built once per session"""
+    keys = [f"level_{i}" for i in range(100)] + ["final"]
+    data = "target_value"
+    # Wrap from the innermost key outwards
+    for key in reversed(keys):
+        data = {key: data}
+    return data, keys
+
+
 class TestFindNestedValue:
     """Test cases for find_nested_value function"""
 
@@ -77,44 +105,25 @@ class TestFindNestedValue:
         result = find_nested_value(data, keys)
         assert result == "numeric_value"
 
-    def test_mixed_data_types(self):
+    @pytest.mark.parametrize(
+        "keys,expected",
+        [
+            pytest.param(["level1", "level2", "string"], "text", id="string"),
+            pytest.param(["level1", "level2", "number"], 42, id="number"),
+            pytest.param(["level1", "level2", "list"], [1, 2, 3], id="list"),
+            pytest.param(
+                ["level1", "level2", "dict"], {"nested": "value"}, id="nested_dict"
+            ),
+            pytest.param(["level1", "level2", "none"], None, id="none"),
+            pytest.param(["level1", "level2", "boolean"], True, id="boolean"),
+        ],
+    )
+    def test_mixed_data_types(self, mixed_data, keys, expected):
         """Test with mixed data types in nested values"""
-        data = {
-            "level1": {
-                "level2": {
-                    "string": "text",
-                    "number": 42,
-                    "list": [1, 2, 3],
-                    "dict": {"nested": "value"},
-                    "none": None,
-                    "boolean": True,
-                }
-            }
-        }
-
-        # Test string value
-        result = find_nested_value(data, ["level1", "level2", "string"])
-        assert result == "text"
-
-        # Test number value
-        result = find_nested_value(data, ["level1", "level2", "number"])
-        assert result == 42
-
-        # Test list value
-        result = find_nested_value(data, ["level1", "level2", "list"])
-        assert result == [1, 2, 3]
-
-        # Test nested dict value
-        result = find_nested_value(data, ["level1", "level2", "dict"])
-        assert result == {"nested": "value"}
-
-        # Test None value
-        result = find_nested_value(data, ["level1", "level2", "none"])
-        assert result is None
-
-        # Test boolean value
-        result = find_nested_value(data, ["level1", "level2", "boolean"])
-        assert result is True
+        result = find_nested_value(mixed_data, keys)
+        assert result == expected
+        # Guard against e.g. 1 == True passing for the boolean case
+        assert type(result) is type(expected)
 
     def test_deep_nesting(self):
         """Test with very deep nesting"""
@@ -146,23 +155,9 @@ class TestFindNestedValue:
         result = find_nested_value(data, keys)
         assert result == "special_value"
 
-    def test_large_nested_structure(self):
+    def test_large_nested_structure(self, deep_nested):
         """Test with large nested structure"""
-        data = {}
-        current = data
-        keys = []
-
-        # Create a large nested structure
-        for i in range(100):
-            key = f"level_{i}"
-            current[key] = {}
-            current = current[key]
-            keys.append(key)
-
-        # Add final value
-        current["final"] = "target_value"
-        keys.append("final")
-
+        data, keys = deep_nested
         result = find_nested_value(data, keys)
         assert result == "target_value"
 
@@ -7,6 +7,24 @@ import pytest
 
 from data.raw.simple.simple2 import generate_password
 
+# Character classes as frozensets so membership is a hash lookup, not a scan
+_UPPER = frozenset(string.ascii_uppercase)
+_LOWER = frozenset(string.ascii_lowercase)
+_DIGITS = frozenset(string.digits)
+_PUNCT = frozenset(string.punctuation)
+
+# Delete-table of every byte generate_password must never emit
+_ALLOWED = (string.ascii_letters + string.digits + string.punctuation).encode()
+_DISALLOWED = bytes(b for b in range(256) if b not in _ALLOWED)
+
+
+def _assert_all_classes(password):
+    """Assert that password contains at least one character of each class"""
+    assert any(c in _UPPER for c in password), f"Missing uppercase in: {password}"
+    assert any(c in _LOWER for c in password), f"Missing lowercase in: {password}"
+    assert any(c in _DIGITS for c in password), f"Missing digit in: {password}"
+    assert any(c in _PUNCT for c in password), f"Missing punctuation in: {password}"
+
 
 class TestGeneratePassword:
     """Test cases for the generate_password function"""
@@ -18,31 +36,22 @@ class TestGeneratePassword:
         # Should generate 12 character password by default
         assert len(password) == 12
         # Should contain at least one of each required character type
-        assert any(c in string.ascii_uppercase for c in password)
-        assert any(c in string.ascii_lowercase for c in password)
-        assert any(c in string.digits for c in password)
-        assert any(c in string.punctuation for c in password)
+        _assert_all_classes(password)
 
-    def test_generate_password_custom_length(self):
+    @pytest.mark.parametrize("length", [8, 10, 15, 20])
+    def test_generate_password_custom_length(self, length):
         """Test generating password with custom valid length"""
-        for length in [8, 10, 15, 20]:
-            password = generate_password(length)
-            assert len(password) == length
-            # Verify all required character types are present
-            assert any(c in string.ascii_uppercase for c in password)
-            assert any(c in string.ascii_lowercase for c in password)
-            assert any(c in string.digits for c in password)
-            assert any(c in string.punctuation for c in password)
+        password = generate_password(length)
+        assert len(password) == length
+        # Verify all required character types are present
+        _assert_all_classes(password)
 
     def test_generate_password_minimum_length(self):
         """Test generating password with minimum allowed length"""
         password = generate_password(8)
         assert len(password) == 8
         # Even at minimum length, should contain all character types
-        assert any(c in string.ascii_uppercase for c in password)
-        assert any(c in string.ascii_lowercase for c in password)
-        assert any(c in string.digits for c in password)
-        assert any(c in string.punctuation for c in password)
+        _assert_all_classes(password)
 
     def test_generate_password_length_too_short(self):
         """Test that length less than 8 raises ValueError"""
@@ -61,22 +70,14 @@ class TestGeneratePassword:
         ):
             generate_password(-5)
 
-    def test_generate_password_character_distribution(self):
+    # Test multiple generations to ensure robustness
+    @pytest.mark.parametrize("trial", range(10))
+    def test_generate_password_character_distribution(self, trial):
         """Test that password contains characters from all required sets"""
-        # Test multiple generations to ensure robustness
-        for _ in range(10):
-            password = generate_password(12)
-
-            # Check for presence of each character type
-            has_upper = any(c in string.ascii_uppercase for c in password)
-            has_lower = any(c in string.ascii_lowercase for c in password)
-            has_digit = any(c in string.digits for c in password)
-            has_punct = any(c in string.punctuation for c in password)
+        password = generate_password(12)
 
-            assert has_upper, f"Missing uppercase in: {password}"
-            assert has_lower, f"Missing lowercase in: {password}"
-            assert has_digit, f"Missing digit in: {password}"
-            assert has_punct, f"Missing punctuation in: {password}"
+        # Check for presence of each character type
+        _assert_all_classes(password)
 
     def test_generate_password_randomness(self):
         """Test that generated passwords are different (random)"""
@@ -87,19 +88,15 @@ class TestGeneratePassword:
             passwords
         ), "Generated passwords should be random"
 
-        # Each password should be unique
-        for i, pass1 in enumerate(passwords):
-            for j, pass2 in enumerate(passwords):
-                if i != j:
-                    assert pass1 != pass2, f"Passwords {i} and {j} should be different"
-
     def test_generate_password_valid_characters(self):
         """Test that password only contains allowed characters"""
         password = generate_password(15)
-        allowed_chars = string.ascii_letters + string.digits + string.punctuation
+        encoded = password.encode()
 
-        for char in password:
-            assert char in allowed_chars, f"Invalid character '{char}' in password"
+        # Stripping disallowed bytes in one C pass must leave the password intact
+        assert (
+            encoded.translate(None, delete=_DISALLOWED) == encoded
+        ), f"Invalid character in password: {password!r}"
 
     @patch("complex_functions.random.shuffle")
     @patch("complex_functions.random.choice")
@@ -127,20 +124,16 @@ class TestGeneratePassword:
         assert len(password_20) == 20
 
         # Verify all character types are present even in longer passwords
-        assert any(c in string.ascii_uppercase for c in password_20)
-        assert any(c in string.ascii_lowercase for c in password_20)
-        assert any(c in string.digits for c in password_20)
-        assert any(c in string.punctuation for c in password_20)
+        _assert_all_classes(password_20)
 
-    def test_generate_password_stress_test(self):
+    # Generate multiple passwords for each length
+    @pytest.mark.parametrize(
+        "length,rep", [(length, rep) for length in (8, 12, 16, 24) for rep in range(3)]
+    )
+    def test_generate_password_stress_test(self, length, rep):
         """Test generating multiple passwords to ensure consistency"""
-        for length in [8, 12, 16, 24]:
-            for _ in range(3):  # Generate multiple passwords for each length
-                password = generate_password(length)
-                assert len(password) == length
-
-                # Basic character type validation
-                assert any(c.isupper() for c in password)
-                assert any(c.islower() for c in password)
-                assert any(c.isdigit() for c in password)
-                assert any(c in string.punctuation for c in password)
+        password = generate_password(length)
+        assert len(password) == length
+
+        # Basic character type validation
+        _assert_all_classes(password)
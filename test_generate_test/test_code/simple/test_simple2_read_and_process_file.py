@@ -1,93 +1,127 @@
 # from complex_functions import read_and_process_file
-import os
-import tempfile
-from unittest.mock import mock_open, patch
+import io
+from unittest.mock import patch
 
 import pytest
 
 from data.raw.simple.simple2 import read_and_process_file
 
+# Logical name -> file content; every file is written once per session
+_FIXTURE_CONTENTS = {
+    "basic": "hello\nworld\npython\ntesting",
+    "empty": "",
+    "whitespace": "  hello  \n\nworld  \n  \npython\n",
+    "numbers": "123\n456\n789",
+    "three_lines": "test\nlines\nhere",
+    "mixed_valid": "valid\ninvalid\nvalid",
+    "single_line": "single line",
+    "unicode": "你好\n世界\nPython测试",
+    "identity": "original\ncontent\npreserved",
+}
 
-class TestReadAndProcessFile:
-    """Test cases for read_and_process_file function"""
 
-    def test_read_and_process_file_success(self):
-        """Test successful file reading and processing"""
-        # Create a temporary file with test content
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, encoding="utf-8") as f:
-            f.write("hello\nworld\npython\ntesting")
-            temp_file_path = f.name
-        try:
-            # Define a simple processor function
-            def uppercase_processor(line):
-                return line.upper()
-
-            # Test the function
-            result = read_and_process_file(temp_file_path, uppercase_processor)
+@pytest.fixture(scope="session")
+def fixture_files(tmp_path_factory):
+    """Write all input files into one temp directory and map names to paths"""
+    base = tmp_path_factory.mktemp("read_and_process_file")
+    paths = {}
+    for name, content in _FIXTURE_CONTENTS.items():
+        path = base / f"{name}.txt"
+        with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            f.write(content)
+        paths[name] = str(path)
+    return paths
 
-            # Assertions
-            expected = ["HELLO", "WORLD", "PYTHON", "TESTING"]
-            assert result == expected
-            assert len(result) == 4
-            assert isinstance(result, list)
 
-        finally:
-            # Clean up
-            os.unlink(temp_file_path)
+# 1000-line payload served from memory; built once, never touches disk
+_LARGE_PAYLOAD = "\n".join(f"line {i}" for i in range(1000))
 
-    def test_read_and_process_file_empty_file(self):
-        """Test processing an empty file"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, encoding="utf-8") as f:
-            f.write("")  # Empty file
-            temp_file_path = f.name
-        try:
 
-            def identity_processor(line):
-                return line
+def _serve_from_memory(monkeypatch, data):
+    """Make the SUT's open() return a StringIO over data; returns the call log"""
+    calls = []
 
-            result = read_and_process_file(temp_file_path, identity_processor)
-            assert result == []
-            assert len(result) == 0
+    def fake_open(*args, **kwargs):
+        calls.append((args, kwargs))
+        return io.StringIO(data)
 
-        finally:
-            os.unlink(temp_file_path)
+    # Shadow the builtin only inside the SUT module, not for pytest itself
+    monkeypatch.setattr("data.raw.simple.simple2.open", fake_open, raising=False)
+    return calls
 
-    def test_read_and_process_file_with_whitespace(self):
-        """Test file with leading/trailing whitespace and empty lines"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, encoding="utf-8") as f:
-            f.write("  hello  \n\nworld  \n  \npython\n")
-            temp_file_path = f.name
-        try:
 
-            def strip_processor(line):
-                return line.strip()
+# Line processors shared by the tests; str methods are passed directly
+def _identity(line):
+    return line
 
-            result = read_and_process_file(temp_file_path, strip_processor)
-            expected = ["hello", "", "world", "", "python", ""]
-            assert result == expected
 
-        finally:
-            os.unlink(temp_file_path)
+def _double(line):
+    try:
+        return str(int(line) * 2)
+    except ValueError:
+        return "invalid"
 
-    def test_read_and_process_file_complex_processor(self):
-        """Test with a more complex processor function"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, encoding="utf-8") as f:
-            f.write("123\n456\n789")
-            temp_file_path = f.name
-        try:
 
-            def multiply_processor(line):
-                try:
-                    return str(int(line) * 2)
-                except ValueError:
-                    return "invalid"
+def _to_none(line):
+    return None
+
+
+def _fail_on_invalid(line):
+    if line == "invalid":
+        raise ValueError("Invalid line detected")
+    return line.upper()
+
+
+def _guarded_upper(line):
+    try:
+        return _fail_on_invalid(line)
+    except ValueError:
+        return "<error>"
+
+
+def _reverse(line):
+    return line[::-1]
+
+
+def _length(line):
+    return str(len(line))
+
+
+def _prefix_processed(line):
+    return f"processed: {line}"
+
+
+class TestReadAndProcessFile:
+    """Test cases for read_and_process_file function"""
+
+    def test_read_and_process_file_success(self, fixture_files):
+        """Test successful file reading and processing"""
+        # Test the function
+        result = read_and_process_file(fixture_files["basic"], str.upper)
+
+        # Assertions
+        expected = ["HELLO", "WORLD", "PYTHON", "TESTING"]
+        assert result == expected
+        assert len(result) == 4
+        assert isinstance(result, list)
 
-            result = read_and_process_file(temp_file_path, multiply_processor)
-            expected = ["246", "912", "1578"]
-            assert result == expected
+    def test_read_and_process_file_empty_file(self, fixture_files):
+        """Test processing an empty file"""
+        result = read_and_process_file(fixture_files["empty"], _identity)
+        assert result == []
+        assert len(result) == 0
 
-        finally:
-            os.unlink(temp_file_path)
+    def test_read_and_process_file_with_whitespace(self, fixture_files):
+        """Test file with leading/trailing whitespace and empty lines"""
+        result = read_and_process_file(fixture_files["whitespace"], str.strip)
+        expected = ["hello", "", "world", "", "python", ""]
+        assert result == expected
+
+    def test_read_and_process_file_complex_processor(self, fixture_files):
+        """Test with a more complex processor function"""
+        result = read_and_process_file(fixture_files["numbers"], _double)
+        expected = ["246", "912", "1578"]
+        assert result == expected
 
     def test_read_and_process_file_nonexistent_file(self):
         """Test handling of non-existent file"""
@@ -95,7 +129,7 @@ class TestReadAndProcessFile:
 
         # Mock print to capture the warning message
         with patch("builtins.print") as mock_print:
-            result = read_and_process_file(non_existent_path, lambda x: x)
+            result = read_and_process_file(non_existent_path, _identity)
 
             # Assertions
             assert result == []
@@ -105,128 +139,60 @@ class TestReadAndProcessFile:
             assert "not found" in call_args
             assert "Returning empty list" in call_args
 
-    def test_read_and_process_file_processor_returns_none(self):
+    def test_read_and_process_file_processor_returns_none(self, fixture_files):
         """Test processor function that returns None"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, encoding="utf-8") as f:
-            f.write("test\nlines\nhere")
-            temp_file_path = f.name
-        try:
-
-            def none_processor(line):
-                return None
-
-            result = read_and_process_file(temp_file_path, none_processor)
-            expected = [None, None, None]
-            assert result == expected
-            assert all(item is None for item in result)
-
-        finally:
-            os.unlink(temp_file_path)
-
-    def test_read_and_process_file_processor_raises_exception(self):
-        """Test processor function that raises an exception"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, encoding="utf-8") as f:
-            f.write("valid\ninvalid\nvalid")
-            temp_file_path = f.name
-        try:
-
-            def failing_processor(line):
-                if line == "invalid":
-                    raise ValueError("Invalid line detected")
-                return line.upper()
-
-            # Should not raise exception, processor errors should be handled by the processor itself
-            result = read_and_process_file(temp_file_path, failing_processor)
-            # The function should process lines until the failing one
-            # Note: This depends on whether the processor handles its own exceptions
-
-        finally:
-            os.unlink(temp_file_path)
-
-    def test_read_and_process_file_single_line(self):
-        """Test file with single line"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, encoding="utf-8") as f:
-            f.write("single line")
-            temp_file_path = f.name
-        try:
+        result = read_and_process_file(fixture_files["three_lines"], _to_none)
+        expected = [None, None, None]
+        assert result == expected
+        assert all(item is None for item in result)
 
-            def reverse_processor(line):
-                return line[::-1]
+    def test_read_and_process_file_processor_raises_exception(self, fixture_files):
+        """Test that a processor exception propagates out of the SUT"""
+        # The SUT only catches FileNotFoundError, so processor errors escape
+        with pytest.raises(ValueError, match="Invalid line detected"):
+            read_and_process_file(fixture_files["mixed_valid"], _fail_on_invalid)
 
-            result = read_and_process_file(temp_file_path, reverse_processor)
-            expected = ["enil elgnis"]
-            assert result == expected
-            assert len(result) == 1
+    def test_read_and_process_file_processor_handles_exception(self, fixture_files):
+        """Test a processor that handles its own exception processes every line"""
+        result = read_and_process_file(fixture_files["mixed_valid"], _guarded_upper)
+        assert result == ["VALID", "<error>", "VALID"]
 
-        finally:
-            os.unlink(temp_file_path)
+    def test_read_and_process_file_single_line(self, fixture_files):
+        """Test file with single line"""
+        result = read_and_process_file(fixture_files["single_line"], _reverse)
+        expected = ["enil elgnis"]
+        assert result == expected
+        assert len(result) == 1
 
-    def test_read_and_process_file_unicode_content(self):
+    def test_read_and_process_file_unicode_content(self, fixture_files):
         """Test file with unicode characters"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, encoding="utf-8") as f:
-            f.write("你好\n世界\nPython测试")
-            temp_file_path = f.name
-        try:
-
-            def length_processor(line):
-                return str(len(line))
-
-            result = read_and_process_file(temp_file_path, length_processor)
-            expected = ["2", "2", "7"]  # Lengths of the strings
-            assert result == expected
-
-        finally:
-            os.unlink(temp_file_path)
+        result = read_and_process_file(fixture_files["unicode"], _length)
+        expected = ["2", "2", "7"]  # Lengths of the strings
+        assert result == expected
 
-    def test_read_and_process_file_large_file(self):
+    def test_read_and_process_file_large_file(self, monkeypatch):
         """Test with a larger file to ensure proper line-by-line processing"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, encoding="utf-8") as f:
-            # Create 1000 lines
-            for i in range(1000):
-                f.write(f"line {i}\n")
-            temp_file_path = f.name
-        try:
-
-            def counter_processor(line):
-                return f"processed: {line}"
-
-            result = read_and_process_file(temp_file_path, counter_processor)
-
-            # Assertions
-            assert len(result) == 1000
-            assert all(line.startswith("processed: line") for line in result)
-            assert result[0] == "processed: line 0"
-            assert result[999] == "processed: line 999"
+        _serve_from_memory(monkeypatch, _LARGE_PAYLOAD)
+        result = read_and_process_file("large.txt", _prefix_processed)
 
-        finally:
-            os.unlink(temp_file_path)
+        # Assertions
+        assert len(result) == 1000
+        assert all(line.startswith("processed: line") for line in result)
+        assert result[0] == "processed: line 0"
+        assert result[999] == "processed: line 999"
 
-    def test_read_and_process_file_identity_processor(self):
+    def test_read_and_process_file_identity_processor(self, fixture_files):
         """Test with identity processor (returns input as-is)"""
-        with tempfile.NamedTemporaryFile(mode="w", delete=False, encoding="utf-8") as f:
-            f.write("original\ncontent\npreserved")
-            temp_file_path = f.name
-        try:
-
-            def identity_processor(line):
-                return line
-
-            result = read_and_process_file(temp_file_path, identity_processor)
-            expected = ["original", "content", "preserved"]
-            assert result == expected
-
-        finally:
-            os.unlink(temp_file_path)
-
-    @patch("builtins.open", new_callable=mock_open, read_data="mocked\ncontent\nhere")
-    def test_read_and_process_file_with_mock(self, mock_file):
-        """Test using mock to simulate file reading"""
+        result = read_and_process_file(fixture_files["identity"], _identity)
+        expected = ["original", "content", "preserved"]
+        assert result == expected
 
-        def uppercase_processor(line):
-            return line.upper()
+    def test_read_and_process_file_with_mock(self, monkeypatch):
+        """Test using an in-memory file to simulate file reading"""
+        calls = _serve_from_memory(monkeypatch, "mocked\ncontent\nhere")
 
-        result = read_and_process_file("dummy_path.txt", uppercase_processor)
+        result = read_and_process_file("dummy_path.txt", str.upper)
 
         expected = ["MOCKED", "CONTENT", "HERE"]
         assert result == expected
-        mock_file.assert_called_once_with("dummy_path.txt", "r", encoding="utf-8")
+        assert calls == [(("dummy_path.txt", "r"), {"encoding": "utf-8"})]
@@ -9,30 +9,54 @@ from data.raw.simple.simple2 import safe_convert_to_int
 class TestSafeConvertToInt:
     """Test cases for safe_convert_to_int function"""
 
-    def test_valid_integer_string(self):
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("123", 123),
+            ("-456", -456),
+            ("0", 0),
+            ("+789", 789),
+        ],
+    )
+    def test_valid_integer_string(self, raw, expected):
         """Test conversion of valid integer strings"""
-        assert safe_convert_to_int("123") == 123
-        assert safe_convert_to_int("-456") == -456
-        assert safe_convert_to_int("0") == 0
-        assert safe_convert_to_int("+789") == 789
-
-    def test_valid_integers(self):
+        assert safe_convert_to_int(raw) == expected
+
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            (123, 123),
+            (-456, -456),
+            (0, 0),
+        ],
+    )
+    def test_valid_integers(self, raw, expected):
         """Test conversion of actual integer values"""
-        assert safe_convert_to_int(123) == 123
-        assert safe_convert_to_int(-456) == -456
-        assert safe_convert_to_int(0) == 0
-
-    def test_float_conversion(self):
+        assert safe_convert_to_int(raw) == expected
+
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            (123.45, 123),
+            (-78.9, -78),
+            (0.0, 0),
+        ],
+    )
+    def test_float_conversion(self, raw, expected):
         """Test conversion of float values (should truncate)"""
-        assert safe_convert_to_int(123.45) == 123
-        assert safe_convert_to_int(-78.9) == -78
-        assert safe_convert_to_int(0.0) == 0
-
-    def test_float_strings(self):
+        assert safe_convert_to_int(raw) == expected
+
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("123.99", 123),
+            ("-45.67", -45),
+            ("0.0", 0),
+        ],
+    )
+    def test_float_strings(self, raw, expected):
         """Test conversion of float strings (should truncate)"""
-        assert safe_convert_to_int("123.99") == 123
-        assert safe_convert_to_int("-45.67") == -45
-        assert safe_convert_to_int("0.0") == 0
+        assert safe_convert_to_int(raw) == expected
 
     def test_boolean_values(self):
         """Test conversion of boolean values"""
@@ -43,12 +67,18 @@ class TestSafeConvertToInt:
         """Test conversion of None value"""
         assert safe_convert_to_int(None) == 0
 
-    def test_invalid_strings(self):
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("abc", 0),
+            ("123abc", 0),
+            ("", 0),
+            ("   ", 0),
+        ],
+    )
+    def test_invalid_strings(self, raw, expected):
         """Test conversion of invalid string values"""
-        assert safe_convert_to_int("abc") == 0
-        assert safe_convert_to_int("123abc") == 0
-        assert safe_convert_to_int("") == 0
-        assert safe_convert_to_int("   ") == 0
+        assert safe_convert_to_int(raw) == expected
 
     def test_complex_numbers(self):
         """Test conversion of complex numbers"""
@@ -59,17 +89,29 @@ class TestSafeConvertToInt:
         assert safe_convert_to_int([1, 2, 3]) == 0
         assert safe_convert_to_int({"key": "value"}) == 0
 
-    def test_whitespace_strings(self):
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("  123  ", 123),
+            ("  -456  ", -456),
+            ("  abc  ", 0),
+        ],
+    )
+    def test_whitespace_strings(self, raw, expected):
         """Test conversion of strings with whitespace"""
-        assert safe_convert_to_int("  123  ") == 123
-        assert safe_convert_to_int("  -456  ") == -456
-        assert safe_convert_to_int("  abc  ") == 0
-
-    def test_scientific_notation(self):
+        assert safe_convert_to_int(raw) == expected
+
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("1e3", 1000),
+            ("1.5e2", 150),
+            ("invalid_e", 0),
+        ],
+    )
+    def test_scientific_notation(self, raw, expected):
         """Test conversion of scientific notation strings"""
-        assert safe_convert_to_int("1e3") == 1000
-        assert safe_convert_to_int("1.5e2") == 150
-        assert safe_convert_to_int("invalid_e") == 0
+        assert safe_convert_to_int(raw) == expected
 
     def test_hexadecimal_strings(self):
         """Test conversion of hexadecimal strings"""
@@ -107,30 +149,38 @@ class TestSafeConvertToInt:
         assert safe_convert_to_int("١٢٣") == 0  # Arabic numerals
         assert safe_convert_to_int("１２３") == 0  # Full-width numerals
 
-    def test_special_numeric_values(self):
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            (math.inf, 0),
+            (-math.inf, 0),
+            (math.nan, 0),
+        ],
+    )
+    def test_special_numeric_values(self, raw, expected):
         """Test conversion of special numeric values"""
-        assert safe_convert_to_int(math.inf) == 0
-        assert safe_convert_to_int(-math.inf) == 0
-        assert safe_convert_to_int(math.nan) == 0
-
-    def test_string_with_newlines(self):
+        assert safe_convert_to_int(raw) == expected
+
+    @pytest.mark.parametrize(
+        "raw,expected",
+        [
+            ("123\n", 123),
+            ("\n456", 456),
+            ("abc\n", 0),
+        ],
+    )
+    def test_string_with_newlines(self, raw, expected):
         """Test conversion of strings containing newlines"""
-        assert safe_convert_to_int("123\n") == 123
-        assert safe_convert_to_int("\n456") == 456
-        assert safe_convert_to_int("abc\n") == 0
+        assert safe_convert_to_int(raw) == expected
 
     def test_capturing_warning_output(self, capsys):
         """Test that warning messages are printed for invalid conversions"""
-        # Test invalid string
-        result = safe_convert_to_int("invalid")
-        captured = capsys.readouterr()
-        assert "Warning: Could not convert 'invalid' to int." in captured.out
-        assert result == 0
-        # Test None value
-        result = safe_convert_to_int(None)
-        captured = capsys.readouterr()
-        assert "Warning: Could not convert 'None' to int." in captured.out
-        assert result == 0
+        # Invalid string and None; drain the capture buffer once for both
+        assert safe_convert_to_int("invalid") == 0
+        assert safe_convert_to_int(None) == 0
+        out = capsys.readouterr().out
+        assert "Warning: Could not convert 'invalid' to int." in out
+        assert "Warning: Could not convert 'None' to int." in out
 
     def test_edge_case_strings(self):
         """Test various edge case strings"""
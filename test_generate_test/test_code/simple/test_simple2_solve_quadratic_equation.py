@@ -5,102 +5,50 @@ import pytest
 
 from data.raw.simple.simple2 import solve_quadratic_equation
 
+# (a, b, c, expected) — 复数根要求精确相等，实数根用 math.isclose 比较
+ROOT_CASES = [
+    # x^2 - 5x + 6 = 0, 根为 3 和 2（较大的根在前）
+    pytest.param(1, -5, 6, [3.0, 2.0], id="two_real_roots"),
+    # x^2 - 4x + 4 = 0, 判别式为 0，重根 2
+    pytest.param(1, -4, 4, [2.0], id="one_real_root"),
+    # x^2 + 2x + 5 = 0, 根为 -1 ± 2i
+    pytest.param(1, 2, 5, [complex(-1, 2), complex(-1, -2)], id="complex_roots"),
+    # x^2 + 1 = 0, 负判别式，根为 i 和 -i
+    pytest.param(1, 0, 1, [complex(0, 1), complex(0, -1)], id="negative_discriminant"),
+    # 0.5x^2 - 1.5x + 1 = 0, 根为 2 和 1
+    pytest.param(0.5, -1.5, 1, [2.0, 1.0], id="float_coefficients"),
+    # -x^2 + 3x - 2 = 0, 根为 1 和 2
+    pytest.param(-1, 3, -2, [1.0, 2.0], id="negative_a_coefficient"),
+    # 1e6x^2 - 2e6x + 1e6 = 0, 重根 1
+    pytest.param(1e6, -2e6, 1e6, [1.0], id="large_coefficients"),
+    # 1e-6x^2 - 2e-6x + 1e-6 = 0, 重根 1
+    pytest.param(1e-6, -2e-6, 1e-6, [1.0], id="small_coefficients"),
+    # x^2 - 4 = 0, 根为 2 和 -2
+    pytest.param(1, 0, -4, [2.0, -2.0], id="edge_case_zero_b"),
+    # x^2 - 3x = 0, 根为 3 和 0
+    pytest.param(1, -3, 0, [3.0, 0.0], id="edge_case_zero_c"),
+]
+
 
 class TestSolveQuadraticEquation:
     """测试一元二次方程求解函数 solve_quadratic_equation"""
 
-    def test_two_real_roots(self):
-        """测试有两个实数根的情况"""
-        # 方程: x^2 - 5x + 6 = 0, 根为 2 和 3
-        result = solve_quadratic_equation(1, -5, 6)
-        expected = [3.0, 2.0]  # 注意：较大的根在前
-        assert len(result) == 2
-        assert math.isclose(result[0], expected[0], rel_tol=1e-9)
-        assert math.isclose(result[1], expected[1], rel_tol=1e-9)
-
-    def test_one_real_root(self):
-        """测试有一个实数根的情况（判别式为0）"""
-        # 方程: x^2 - 4x + 4 = 0, 根为 2（重根）
-        result = solve_quadratic_equation(1, -4, 4)
-        expected = [2.0]
-        assert len(result) == 1
-        assert math.isclose(result[0], expected[0], rel_tol=1e-9)
-
-    def test_complex_roots(self):
-        """测试有两个复数根的情况"""
-        # 方程: x^2 + 2x + 5 = 0, 根为 -1 ± 2i
-        result = solve_quadratic_equation(1, 2, 5)
-        expected = [complex(-1, 2), complex(-1, -2)]
-        assert len(result) == 2
-        assert result[0] == expected[0]
-        assert result[1] == expected[1]
-
-    def test_negative_discriminant(self):
-        """测试负判别式产生复数根"""
-        # 方程: x^2 + 1 = 0, 根为 i 和 -i
-        result = solve_quadratic_equation(1, 0, 1)
-        expected = [complex(0, 1), complex(0, -1)]
-        assert len(result) == 2
-        assert result[0] == expected[0]
-        assert result[1] == expected[1]
-
-    def test_float_coefficients(self):
-        """测试浮点数系数"""
-        # 方程: 0.5x^2 - 1.5x + 1 = 0, 根为 1 和 2
-        result = solve_quadratic_equation(0.5, -1.5, 1)
-        expected = [2.0, 1.0]
-        assert len(result) == 2
-        assert math.isclose(result[0], expected[0], rel_tol=1e-9)
-        assert math.isclose(result[1], expected[1], rel_tol=1e-9)
-
-    def test_negative_a_coefficient(self):
-        """测试负的二次项系数"""
-        # 方程: -x^2 + 3x - 2 = 0, 根为 1 和 2
-        result = solve_quadratic_equation(-1, 3, -2)
-        expected = [1.0, 2.0]
-        assert len(result) == 2
-        assert math.isclose(result[0], expected[0], rel_tol=1e-9)
-        assert math.isclose(result[1], expected[1], rel_tol=1e-9)
+    @pytest.mark.parametrize("a,b,c,expected", ROOT_CASES)
+    def test_roots(self, a, b, c, expected):
+        """测试各类系数下根的个数、顺序和数值"""
+        result = solve_quadratic_equation(a, b, c)
+        assert len(result) == len(expected)
+        for root, want in zip(result, expected):
+            if isinstance(want, complex):
+                assert root == want
+            else:
+                assert math.isclose(root, want, rel_tol=1e-9)
 
     def test_zero_a_coefficient_raises_error(self):
         """测试a=0时抛出ValueError"""
         with pytest.raises(ValueError, match="Coefficient 'a' cannot be zero"):
             solve_quadratic_equation(0, 2, 3)
 
-    def test_large_coefficients(self):
-        """测试大系数的情况"""
-        # 方程: 1e6x^2 - 2e6x + 1e6 = 0, 根为 1（重根）
-        result = solve_quadratic_equation(1e6, -2e6, 1e6)
-        expected = [1.0]
-        assert len(result) == 1
-        assert math.isclose(result[0], expected[0], rel_tol=1e-9)
-
-    def test_small_coefficients(self):
-        """测试小系数的情况"""
-        # 方程: 1e-6x^2 - 2e-6x + 1e-6 = 0, 根为 1（重根）
-        result = solve_quadratic_equation(1e-6, -2e-6, 1e-6)
-        expected = [1.0]
-        assert len(result) == 1
-        assert math.isclose(result[0], expected[0], rel_tol=1e-9)
-
-    def test_edge_case_zero_b(self):
-        """测试b=0的情况"""
-        # 方程: x^2 - 4 = 0, 根为 2 和 -2
-        result = solve_quadratic_equation(1, 0, -4)
-        expected = [2.0, -2.0]
-        assert len(result) == 2
-        assert math.isclose(result[0], expected[0], rel_tol=1e-9)
-        assert math.isclose(result[1], expected[1], rel_tol=1e-9)
-
-    def test_edge_case_zero_c(self):
-        """测试c=0的情况"""
-        # 方程: x^2 - 3x = 0, 根为 3 和 0
-        result = solve_quadratic_equation(1, -3, 0)
-        expected = [3.0, 0.0]
-        assert len(result) == 2
-        assert math.isclose(result[0], expected[0], rel_tol=1e-9)
-        assert math.isclose(result[1], expected[1], rel_tol=1e-9)
-
     def test_near_zero_discriminant(self):
         """测试判别式接近0的情况"""
         # 方程: x^2 - 2x + 1.0000000001 = 0 (判别式接近0)
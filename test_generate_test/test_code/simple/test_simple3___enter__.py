@@ -1,11 +1,15 @@
 import threading
 import time
+from unittest.mock import patch
 
 import pytest
 
 # from advanced_functions import TimedOperation
 from data.raw.simple.simple3 import TimedOperation
 
+# Patch the clock where TimedOperation looks it up, so timing tests need no sleep
+_SIMPLE3_TIME = "data.raw.simple.simple3.time"
+
 
 class TestTimedOperationEnter:
     """Test suite for TimedOperation.__enter__ method"""
@@ -19,7 +23,6 @@ class TestTimedOperationEnter:
         with timer as context_obj:
             # Assert
             assert context_obj is timer
-            assert isinstance(context_obj, TimedOperation)
 
     def test_enter_sets_start_time(self):
         """Test that __enter__ correctly sets the start_time attribute"""
@@ -29,11 +32,8 @@ class TestTimedOperationEnter:
         # Act
         with timer as context_obj:
             # Assert
-            assert hasattr(context_obj, "start_time")
-            assert isinstance(context_obj.start_time, float)
-            assert context_obj.start_time > 0
-            # Should be recent (within last second)
-            assert time.time() - context_obj.start_time < 1
+            # Set, numeric and recent (within last second) in one check
+            assert 0 <= time.time() - context_obj.start_time < 1
 
     def test_enter_multiple_contexts_independent(self):
         """Test that multiple context managers have independent start times"""
@@ -41,12 +41,14 @@ class TestTimedOperationEnter:
         timer1 = TimedOperation()
         timer2 = TimedOperation()
 
-        # Act & Assert
-        with timer1 as ctx1:
-            time.sleep(0.01)  # Small delay to ensure different start times
-            with timer2 as ctx2:
-                assert ctx1.start_time < ctx2.start_time
-                assert ctx2.start_time - ctx1.start_time >= 0.01
+        # Act & Assert - clock reads: enter1, enter2, exit2, exit1
+        with patch(_SIMPLE3_TIME) as mock_time:
+            mock_time.time.side_effect = [1000.0, 1001.0, 1002.0, 1003.0]
+            with timer1 as ctx1:
+                with timer2 as ctx2:
+                    # Each instance keeps the timestamp read on its own entry
+                    assert ctx1.start_time == 1000.0
+                    assert ctx2.start_time == 1001.0
 
     def test_enter_nested_context_managers(self):
         """Test that nested context managers work correctly"""
@@ -61,9 +63,7 @@ class TestTimedOperationEnter:
             with inner_timer as inner:
                 inner_start = inner.start_time
 
-                # Both should have start times set
-                assert hasattr(outer, "start_time")
-                assert hasattr(inner, "start_time")
+                # Both start times were read above; inner entered later
                 assert inner_start > outer_start
 
     def test_enter_reused_context_manager(self):
@@ -71,17 +71,18 @@ class TestTimedOperationEnter:
         # Arrange
         timer = TimedOperation()
 
-        # Act & Assert - First use
-        with timer as ctx1:
-            first_start = ctx1.start_time
+        with patch(_SIMPLE3_TIME) as mock_time:
+            # (enter, exit) for each use, 10ms apart
+            mock_time.time.side_effect = [1000.0, 1000.001, 1000.011, 1000.012]
 
-        # Small delay between uses
-        time.sleep(0.01)
+            # Act & Assert - First use
+            with timer as ctx1:
+                first_start = ctx1.start_time
 
-        # Second use - should work fine
-        with timer as ctx2:
-            second_start = ctx2.start_time
-            assert second_start > first_start
+            # Second use - should work fine
+            with timer as ctx2:
+                second_start = ctx2.start_time
+                assert second_start > first_start
 
     def test_enter_with_exception_in_context(self):
         """Test that __enter__ works even when context block raises exception"""
@@ -109,7 +110,6 @@ class TestTimedOperationEnter:
             assert ctx.start_time is not None
 
         # Outside context - start_time should still be accessible
-        assert hasattr(timer, "start_time")
         assert timer.start_time is not None
 
     def test_enter_timing_accuracy(self):
@@ -125,33 +125,28 @@ class TestTimedOperationEnter:
             # Assert - start_time should be between before and after
             assert before_enter <= ctx.start_time <= after_enter
 
-    def test_enter_concurrent_access(self):
+    def test_enter_concurrent_access(self, thread_pool):
         """Test that __enter__ handles concurrent access correctly"""
         # Arrange
-
         results = []
+        results_lock = threading.Lock()
         timer = TimedOperation()
 
         def worker(worker_id):
             with timer as ctx:
-                results.append((worker_id, ctx.start_time))
+                with results_lock:
+                    results.append((worker_id, ctx.start_time))
 
         # Act
-        threads = []
-        for i in range(3):
-            thread = threading.Thread(target=worker, args=(i,))
-            threads.append(thread)
-            thread.start()
-
-        for thread in threads:
-            thread.join()
+        futures = [thread_pool.submit(worker, i) for i in range(3)]
+        for future in futures:
+            future.result()
 
         # Assert - Each worker should get its own context with proper start time
         assert len(results) == 3
         worker_ids, start_times = zip(*results)
         assert set(worker_ids) == {0, 1, 2}
         # All start times should be valid
-        assert all(isinstance(st, float) for st in start_times)
         assert all(st > 0 for st in start_times)
 
     def test_enter_method_signature(self):
@@ -1,4 +1,4 @@
-import time
+from unittest.mock import patch
 
 import pytest
 
@@ -6,14 +6,19 @@ from data.raw.simple.simple3 import TimedOperation
 
 # from advanced_functions import TimedOperation
 
+# 只替换被测模块里引用的 time，时间戳由 side_effect 给出，无需真实 sleep
+_SIMPLE3_TIME = "data.raw.simple.simple3.time"
+
 
 class TestTimedOperationExit:
     """测试 TimedOperation 类的 __exit__ 方法"""
 
     def test_exit_normal_operation(self):
         """测试正常情况下的 __exit__ 方法"""
-        with TimedOperation() as timer:
-            time.sleep(0.01)  # 短暂延迟
+        with patch(_SIMPLE3_TIME) as mock_time:
+            mock_time.time.side_effect = [1000.0, 1000.01]  # 10ms 的操作
+            with TimedOperation() as timer:
+                pass
 
         # 断言持续时间被正确计算
         assert hasattr(timer, "duration")
@@ -49,21 +54,28 @@ class TestTimedOperationExit:
 
     def test_exit_duration_calculation(self):
         """测试持续时间的计算准确性"""
-        with TimedOperation() as timer:
-            time.sleep(0.1)  # 固定延迟以便测试
+        with patch(_SIMPLE3_TIME) as mock_time:
+            mock_time.time.side_effect = [1000.0, 1000.1]  # 固定 100ms 的时间差
+            with TimedOperation() as timer:
+                pass
 
         # 验证持续时间计算正确
         expected_duration = timer.end_time - timer.start_time
-        assert abs(timer.duration - expected_duration) < 0.001  # 允许微小误差
+        assert timer.duration == expected_duration
+        assert timer.duration == pytest.approx(0.1)
 
     def test_exit_multiple_operations(self):
         """测试多次操作时的 __exit__ 方法行为"""
         durations = []
 
-        for i in range(3):
-            with TimedOperation() as timer:
-                time.sleep(0.01 * (i + 1))  # 不同的延迟
-            durations.append(timer.duration)
+        # 每次操作一对 (开始, 结束) 时间戳，时长依次为 10ms、20ms、30ms
+        timestamps = [1000.0, 1000.01, 2000.0, 2000.02, 3000.0, 3000.03]
+        with patch(_SIMPLE3_TIME) as mock_time:
+            mock_time.time.side_effect = timestamps
+            for _ in range(3):
+                with TimedOperation() as timer:
+                    pass
+                durations.append(timer.duration)
 
         # 验证每次操作都有独立的持续时间
         assert len(durations) == 3
@@ -71,17 +83,15 @@ class TestTimedOperationExit:
         # 延迟时间应该递增
         assert durations[0] < durations[1] < durations[2]
 
-    def test_exit_with_different_exception_types(self):
+    @pytest.mark.parametrize("exc_type", [ValueError, TypeError, RuntimeError])
+    def test_exit_with_different_exception_types(self, exc_type):
         """测试不同类型的异常处理"""
-        exception_types = [ValueError, TypeError, RuntimeError]
-
-        for exc_type in exception_types:
-            with pytest.raises(exc_type):
-                with TimedOperation() as timer:
-                    raise exc_type("Test exception")
+        with pytest.raises(exc_type):
+            with TimedOperation() as timer:
+                raise exc_type("Test exception")
 
-            # 验证即使有异常，持续时间也被记录
-            assert timer.duration > 0
+        # 验证即使有异常，持续时间也被记录
+        assert timer.duration > 0
 
     def test_exit_return_value_behavior(self):
         """测试 __exit__ 方法的返回值行为"""
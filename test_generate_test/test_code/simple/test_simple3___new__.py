@@ -1,5 +1,4 @@
 import threading
-import time
 
 import pytest
 
@@ -11,23 +10,18 @@ from data.raw.simple.simple3 import SingletonDatabase, __new__
 class TestSingletonDatabaseNew:
     """针对 SingletonDatabase.__new__ 方法的单元测试"""
 
-    def test_singleton_creation_initial_instance(self):
+    def test_singleton_creation_initial_instance(self, fresh_singleton):
         """测试首次创建单例实例"""
-        # 确保没有现有实例
-        SingletonDatabase._instance = None
-
-        instance = SingletonDatabase()
+        instance = fresh_singleton
 
         assert instance is not None
         assert hasattr(instance, "connection")
         assert isinstance(instance.connection, str)
         assert instance.connection.startswith("DBConnection_")
 
-    def test_singleton_returns_same_instance(self):
+    def test_singleton_returns_same_instance(self, shared_singleton):
         """测试多次调用返回相同实例"""
-        SingletonDatabase._instance = None
-
-        instance1 = SingletonDatabase()
+        instance1 = shared_singleton
         instance2 = SingletonDatabase()
         instance3 = SingletonDatabase()
 
@@ -35,35 +29,28 @@ class TestSingletonDatabaseNew:
         assert instance2 is instance3
         assert instance1 is instance3
 
-    def test_singleton_thread_safety(self):
+    def test_singleton_thread_safety(self, reset_singleton, thread_pool):
         """测试多线程环境下的线程安全性"""
-        SingletonDatabase._instance = None
-        instances = []
+        # reset_singleton 保证线程启动前没有实例，由线程竞争首次创建
+        # 10 个线程先在 Barrier 处会合再同时创建，确保真正发生竞争；
+        # 线程池正好有 10 个 worker，timeout 防止意外情况下永久阻塞
+        barrier = threading.Barrier(10, timeout=5)
 
         def create_instance():
-            instance = SingletonDatabase()
-            instances.append(instance)
+            barrier.wait()
+            return SingletonDatabase()
 
-        # 创建多个线程同时尝试创建实例
-        threads = []
-        for _ in range(10):
-            thread = threading.Thread(target=create_instance)
-            threads.append(thread)
-            thread.start()
-
-        for thread in threads:
-            thread.join()
+        futures = [thread_pool.submit(create_instance) for _ in range(10)]
+        instances = [future.result() for future in futures]
 
         # 所有实例应该是同一个对象
         first_instance = instances[0]
         for instance in instances[1:]:
             assert instance is first_instance
 
-    def test_singleton_connection_uniqueness(self):
+    def test_singleton_connection_uniqueness(self, fresh_singleton):
         """测试每个单例实例的连接字符串是唯一的"""
-        SingletonDatabase._instance = None
-
-        instance1 = SingletonDatabase()
+        instance1 = fresh_singleton
         connection1 = instance1.connection
 
         # 模拟重新创建单例（在实际使用中不会发生，但测试边界情况）
@@ -75,11 +62,9 @@ class TestSingletonDatabaseNew:
         assert connection1 != connection2
         assert instance1 is not instance2
 
-    def test_singleton_methods_accessible(self):
+    def test_singleton_methods_accessible(self, shared_singleton):
         """测试单例实例的方法可正常访问"""
-        SingletonDatabase._instance = None
-
-        instance = SingletonDatabase()
+        instance = shared_singleton
 
         # 测试方法调用
         connection_str = instance.get_connection()
@@ -89,11 +74,10 @@ class TestSingletonDatabaseNew:
         # 测试close方法（虽然单例中不常用）
         instance.close()  # 应该正常执行，不抛出异常
 
-    def test_singleton_with_existing_instance(self):
+    def test_singleton_with_existing_instance(self, shared_singleton):
         """测试当实例已存在时的行为"""
         # 先创建一个实例
-        SingletonDatabase._instance = None
-        original_instance = SingletonDatabase()
+        original_instance = shared_singleton
         original_connection = original_instance.connection
 
         # 再次创建应该返回相同实例
@@ -102,27 +86,22 @@ class TestSingletonDatabaseNew:
         assert new_instance is original_instance
         assert new_instance.connection == original_connection
 
-    def test_singleton_instance_persistence(self):
+    def test_singleton_instance_persistence(self, shared_singleton):
         """测试单例实例的持久性"""
-        SingletonDatabase._instance = None
-
         # 创建实例并存储连接信息
-        instance1 = SingletonDatabase()
+        instance1 = shared_singleton
         connection1 = instance1.connection
 
-        # 模拟程序运行一段时间后再次访问
-        time.sleep(0.05)
+        # 稍后再次访问（单例状态与经过的时间无关，无需真实等待）
         instance2 = SingletonDatabase()
 
         # 应该还是同一个实例，连接信息不变
         assert instance2 is instance1
         assert instance2.connection == connection1
 
-    def test_singleton_after_close_simulation(self):
+    def test_singleton_after_close_simulation(self, shared_singleton):
         """测试模拟关闭连接后的行为（边界情况）"""
-        SingletonDatabase._instance = None
-
-        instance1 = SingletonDatabase()
+        instance1 = shared_singleton
         instance1.close()  # 模拟关闭（单例模式下实际不关闭）
 
         # 关闭后再次获取应该还是同一个实例
@@ -131,27 +110,14 @@ class TestSingletonDatabaseNew:
 
     def test_singleton_lock_mechanism(self):
         """测试锁机制确保线程安全"""
-        SingletonDatabase._instance = None
-
         # 验证锁对象存在且是线程锁
         assert hasattr(SingletonDatabase, "_lock")
         assert isinstance(SingletonDatabase._lock, type(threading.Lock()))
 
-    def test_singleton_double_checked_locking(self):
+    def test_singleton_double_checked_locking(self, fresh_singleton):
         """测试双重检查锁定模式"""
-        SingletonDatabase._instance = None
-
-        # 第一次检查（无实例）
-        if SingletonDatabase._instance is None:
-            # 获取锁
-            with SingletonDatabase._lock:
-                # 第二次检查（仍然无实例）
-                if SingletonDatabase._instance is None:
-                    # 创建实例
-                    instance = super(SingletonDatabase, SingletonDatabase).__new__(
-                        SingletonDatabase
-                    )
-                    SingletonDatabase._instance = instance
-
-        # 验证实例创建成功
-        assert SingletonDatabase._instance is not None
+        # 通过真实的 __new__ 走完一次加锁创建，而不是在测试里重写一遍
+        assert SingletonDatabase._instance is fresh_singleton
+        # 创建完成后锁已释放，后续调用走无锁的第一次检查
+        assert not SingletonDatabase._lock.locked()
+        assert SingletonDatabase() is fresh_singleton
@@ -1,117 +1,96 @@
-import threading
-from unittest.mock import MagicMock, patch
-
 import pytest
 
 from data.raw.simple.simple3 import SingletonDatabase
 
 
+@pytest.fixture(scope="module")
+def expected_close_msg(shared_singleton):
+    """The message close() prints for the shared instance, built once"""
+    return f"Closing connection: {shared_singleton.get_connection()}"
+
+
 class TestCloseFunction:
     """Test cases for the close method in SingletonDatabase class"""
 
-    def test_close_method_exists(self):
+    def test_close_method_exists(self, shared_singleton):
         """Test that close method exists and is callable"""
         # Arrange
-        db = SingletonDatabase()
+        db = shared_singleton
 
         # Act & Assert
         assert hasattr(db, "close")
         assert callable(db.close)
 
-    def test_close_method_prints_correct_message(self):
+    def test_close_method_prints_correct_message(
+        self, shared_singleton, print_calls, expected_close_msg
+    ):
         """Test that close method prints the correct connection message"""
-        # Arrange
-        db = SingletonDatabase()
-        connection_string = db.get_connection()
+        # Act
+        shared_singleton.close()
 
-        # Act & Assert
-        with patch("builtins.print") as mock_print:
-            db.close()
-            mock_print.assert_called_once_with(
-                f"Closing connection: {connection_string}"
-            )
+        # Assert
+        assert print_calls == [(expected_close_msg,)]
 
-    def test_close_method_called_multiple_times(self):
+    def test_close_method_called_multiple_times(
+        self, shared_singleton, print_calls, expected_close_msg
+    ):
         """Test that close method can be called multiple times without errors"""
         # Arrange
-        db = SingletonDatabase()
+        db = shared_singleton
 
-        # Act & Assert
-        with patch("builtins.print") as mock_print:
-            # Call close multiple times
-            db.close()
-            db.close()
-            db.close()
+        # Act - Call close multiple times
+        db.close()
+        db.close()
+        db.close()
 
-            # Should print the same message each time
-            assert mock_print.call_count == 3
-            # All calls should have the same connection string
-            connection_string = db.get_connection()
-            expected_call = f"Closing connection: {connection_string}"
-            for call in mock_print.call_args_list:
-                assert call[0][0] == expected_call
+        # Assert - the same message is printed each time
+        assert print_calls == [(expected_close_msg,)] * 3
 
-    def test_close_after_get_connection(self):
+    def test_close_after_get_connection(
+        self, shared_singleton, print_calls, expected_close_msg
+    ):
         """Test close method behavior after get_connection has been called"""
         # Arrange
-        db = SingletonDatabase()
+        db = shared_singleton
         original_connection = db.get_connection()
 
         # Act
-        with patch("builtins.print") as mock_print:
-            db.close()
+        db.close()
 
         # Assert
-        mock_print.assert_called_once_with(f"Closing connection: {original_connection}")
+        assert print_calls == [(expected_close_msg,)]
         # Connection should still be available after close (singleton behavior)
         assert db.get_connection() == original_connection
 
-    def test_close_preserves_singleton_instance(self):
+    def test_close_preserves_singleton_instance(self, shared_singleton, print_calls):
         """Test that close method doesn't affect the singleton instance"""
         # Arrange
-        db1 = SingletonDatabase()
+        db1 = shared_singleton
         db2 = SingletonDatabase()
 
         # Act
-        with patch("builtins.print"):
-            db1.close()
+        db1.close()
 
         # Assert - both references should point to same instance
         assert db1 is db2
         assert db1.get_connection() == db2.get_connection()
 
-    def test_close_in_different_threads(self):
+    def test_close_in_different_threads(
+        self, shared_singleton, thread_pool, print_calls, expected_close_msg
+    ):
         """Test close method behavior when called from different threads"""
-        # Arrange
-        db = SingletonDatabase()
-        connection_string = db.get_connection()
-        results = []
-
-        def close_in_thread():
-            with patch("builtins.print") as mock_print:
-                db.close()
-                results.append(mock_print.call_args[0][0])
-
-        # Act
-        threads = []
-        for _ in range(3):
-            thread = threading.Thread(target=close_in_thread)
-            threads.append(thread)
-            thread.start()
-
-        for thread in threads:
-            thread.join()
+        # Act - one recorder spans all threads, so no per-thread patching races
+        futures = [thread_pool.submit(shared_singleton.close) for _ in range(3)]
+        for future in futures:
+            future.result()
 
         # Assert
-        expected_message = f"Closing connection: {connection_string}"
-        for result in results:
-            assert result == expected_message
-        assert len(results) == 3
+        assert print_calls == [(expected_close_msg,)] * 3
 
-    def test_close_method_does_not_raise_exceptions(self):
+    def test_close_method_does_not_raise_exceptions(self, shared_singleton):
         """Test that close method doesn't raise any exceptions"""
         # Arrange
-        db = SingletonDatabase()
+        db = shared_singleton
 
         # Act & Assert - should not raise any exceptions
         try:
@@ -119,10 +98,10 @@ class TestCloseFunction:
         except Exception as e:
             pytest.fail(f"close method raised an exception: {e}")
 
-    def test_close_method_return_value(self):
+    def test_close_method_return_value(self, shared_singleton):
         """Test that close method returns None (implicitly)"""
         # Arrange
-        db = SingletonDatabase()
+        db = shared_singleton
 
         # Act
         result = db.close()
@@ -130,16 +109,15 @@ class TestCloseFunction:
         # Assert
         assert result is None
 
-    @patch("SingletonDatabase._instance", None)
-    def test_close_on_fresh_instance(self):
+    def test_close_on_fresh_instance(self, fresh_singleton, print_calls):
         """Test close method on a freshly created instance"""
-        # Arrange - Reset singleton and create new instance
-        SingletonDatabase._instance = None
-        db = SingletonDatabase()
+        # Arrange - fixture resets the singleton and creates a new instance
+        # (requested before print_calls, so its creation message isn't recorded)
+        db = fresh_singleton
 
-        # Act & Assert
-        with patch("builtins.print") as mock_print:
-            db.close()
-            mock_print.assert_called_once()
-            # Should contain the connection string pattern
-            assert "Closing connection: DBConnection_" in mock_print.call_args[0][0]
+        # Act
+        db.close()
+
+        # Assert - Should contain the connection string pattern
+        assert len(print_calls) == 1
+        assert "Closing connection: DBConnection_" in print_calls[0][0]
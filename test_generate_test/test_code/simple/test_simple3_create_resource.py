@@ -3,48 +3,105 @@ import pytest
 
 from data.raw.simple.simple3 import create_resource
 
-
-class TestCreateResource:
-    """Test cases for the create_resource factory function."""
-
-    def test_create_user_with_required_fields(self):
-        """Test creating a user with only required fields."""
-        # Arrange
-        resource_type = "user"
-        user_data = {"id": 1, "name": "John Doe", "email": "john@example.com"}
-
-        # Act
-        result = create_resource(resource_type, **user_data)
-
-        # Assert
-        assert isinstance(result, dict)
-        assert result["id"] == 1
-        assert result["name"] == "John Doe"
-        assert result["email"] == "john@example.com"
-        assert result["balance"] == 0.0  # Default value
-        assert result["is_active"] is True  # Default value
-
-    def test_create_user_with_all_fields(self):
-        """Test creating a user with all fields provided."""
-        # Arrange
-        resource_type = "user"
-        user_data = {
+# (resource_type, kwargs, expected) — the full expected dict also checks that
+# defaults are filled in and extra kwargs are dropped
+HAPPY_PATH_CASES = [
+    pytest.param(
+        "user",
+        {"id": 1, "name": "John Doe", "email": "john@example.com"},
+        {
+            "id": 1,
+            "name": "John Doe",
+            "email": "john@example.com",
+            "balance": 0.0,
+            "is_active": True,
+        },
+        id="user_with_required_fields",
+    ),
+    pytest.param(
+        "user",
+        {
             "id": 2,
             "name": "Jane Smith",
             "email": "jane@example.com",
             "balance": 100.50,
             "is_active": False,
-        }
+        },
+        {
+            "id": 2,
+            "name": "Jane Smith",
+            "email": "jane@example.com",
+            "balance": 100.50,
+            "is_active": False,
+        },
+        id="user_with_all_fields",
+    ),
+    pytest.param(
+        "user",
+        {
+            "id": 3,
+            "name": "Bob Wilson",
+            "email": "bob@example.com",
+            "extra_field": "should_be_ignored",
+            "another_extra": 123,
+        },
+        {
+            "id": 3,
+            "name": "Bob Wilson",
+            "email": "bob@example.com",
+            "balance": 0.0,
+            "is_active": True,
+        },
+        id="user_with_extra_fields",
+    ),
+    pytest.param(
+        "user",
+        {"id": None, "name": None, "email": None},
+        {"id": None, "name": None, "email": None, "balance": 0.0, "is_active": True},
+        id="user_with_none_values",
+    ),
+    pytest.param(
+        "user",
+        {"id": 1, "name": "", "email": ""},
+        {"id": 1, "name": "", "email": "", "balance": 0.0, "is_active": True},
+        id="user_with_empty_strings",
+    ),
+    pytest.param(
+        "product",
+        {"id": 1, "name": "Laptop"},
+        {"id": 1, "name": "Laptop", "price": 0.0, "category": "uncategorized"},
+        id="product_with_minimal_fields",
+    ),
+    pytest.param(
+        "product",
+        {"id": 2, "name": "Smartphone", "price": 999.99, "category": "Electronics"},
+        {"id": 2, "name": "Smartphone", "price": 999.99, "category": "Electronics"},
+        id="product_with_all_fields",
+    ),
+    pytest.param(
+        "product",
+        {
+            "id": 3,
+            "name": "Tablet",
+            "price": 499.99,
+            "category": "Electronics",
+            "description": "A great tablet",
+            "weight": 0.5,
+        },
+        {"id": 3, "name": "Tablet", "price": 499.99, "category": "Electronics"},
+        id="product_with_extra_fields",
+    ),
+]
 
-        # Act
-        result = create_resource(resource_type, **user_data)
 
-        # Assert
-        assert result["id"] == 2
-        assert result["name"] == "Jane Smith"
-        assert result["email"] == "jane@example.com"
-        assert result["balance"] == 100.50
-        assert result["is_active"] is False
+class TestCreateResource:
+    """Test cases for the create_resource factory function."""
+
+    @pytest.mark.parametrize("resource_type,kwargs,expected", HAPPY_PATH_CASES)
+    def test_create_resource(self, resource_type, kwargs, expected):
+        """Test creating users and products from valid input."""
+        result = create_resource(resource_type, **kwargs)
+        assert result == expected
 
     def test_create_user_missing_required_field(self):
         """Test creating a user with missing required fields."""
@@ -63,88 +120,6 @@ class TestCreateResource:
         assert "Missing required fields for 'user'" in str(exc_info.value)
         assert "email" in str(exc_info.value)
 
-    def test_create_user_with_extra_fields(self):
-        """Test creating a user with extra fields that should be ignored."""
-        # Arrange
-        resource_type = "user"
-        user_data = {
-            "id": 3,
-            "name": "Bob Wilson",
-            "email": "bob@example.com",
-            "extra_field": "should_be_ignored",
-            "another_extra": 123,
-        }
-
-        # Act
-        result = create_resource(resource_type, **user_data)
-
-        # Assert
-        assert result["id"] == 3
-        assert result["name"] == "Bob Wilson"
-        assert result["email"] == "bob@example.com"
-        assert "extra_field" not in result
-        assert "another_extra" not in result
-
-    def test_create_product_with_minimal_fields(self):
-        """Test creating a product with minimal fields."""
-        # Arrange
-        resource_type = "product"
-        product_data = {"id": 1, "name": "Laptop"}
-
-        # Act
-        result = create_resource(resource_type, **product_data)
-
-        # Assert
-        assert isinstance(result, dict)
-        assert result["id"] == 1
-        assert result["name"] == "Laptop"
-        assert result["price"] == 0.0  # Default value
-        assert result["category"] == "uncategorized"  # Default value
-
-    def test_create_product_with_all_fields(self):
-        """Test creating a product with all fields provided."""
-        # Arrange
-        resource_type = "product"
-        product_data = {
-            "id": 2,
-            "name": "Smartphone",
-            "price": 999.99,
-            "category": "Electronics",
-        }
-
-        # Act
-        result = create_resource(resource_type, **product_data)
-
-        # Assert
-        assert result["id"] == 2
-        assert result["name"] == "Smartphone"
-        assert result["price"] == 999.99
-        assert result["category"] == "Electronics"
-
-    def test_create_product_with_extra_fields(self):
-        """Test creating a product with extra fields that should be ignored."""
-        # Arrange
-        resource_type = "product"
-        product_data = {
-            "id": 3,
-            "name": "Tablet",
-            "price": 499.99,
-            "category": "Electronics",
-            "description": "A great tablet",  # Extra field
-            "weight": 0.5,  # Extra field
-        }
-
-        # Act
-        result = create_resource(resource_type, **product_data)
-
-        # Assert
-        assert result["id"] == 3
-        assert result["name"] == "Tablet"
-        assert result["price"] == 499.99
-        assert result["category"] == "Electronics"
-        assert "description" not in result
-        assert "weight" not in result
-
     def test_unknown_resource_type(self):
         """Test creating an unknown resource type."""
         # Arrange
@@ -179,77 +154,49 @@ class TestCreateResource:
         with pytest.raises(TypeError):
             create_resource(resource_type, **data)
 
-    def test_user_with_none_values(self):
-        """Test creating a user with None values for required fields."""
+    @pytest.mark.parametrize(
+        "balance_input,expected_balance",
+        [
+            pytest.param(0.0, 0.0, id="zero"),
+            pytest.param(-100.0, -100.0, id="negative"),
+            pytest.param(999999.99, 999999.99, id="large_positive"),
+            pytest.param(0.001, 0.001, id="very_small"),
+        ],
+    )
+    def test_user_balance_edge_cases(self, balance_input, expected_balance):
+        """Test creating users with edge case balance values."""
         # Arrange
         resource_type = "user"
-        user_data = {"id": None, "name": None, "email": None}
+        user_data = {
+            "id": 1,
+            "name": "Test User",
+            "email": "test@example.com",
+            "balance": balance_input,
+        }
 
         # Act
         result = create_resource(resource_type, **user_data)
 
         # Assert
-        assert result["id"] is None
-        assert result["name"] is None
-        assert result["email"] is None
-
-    def test_user_with_empty_strings(self):
-        """Test creating a user with empty string values."""
+        assert result["balance"] == expected_balance
+
+    @pytest.mark.parametrize(
+        "price_input,expected_price",
+        [
+            pytest.param(0.0, 0.0, id="zero"),
+            pytest.param(-50.0, -50.0, id="negative"),
+            pytest.param(1000000.0, 1000000.0, id="large"),
+            pytest.param(0.01, 0.01, id="small"),
+        ],
+    )
+    def test_product_price_edge_cases(self, price_input, expected_price):
+        """Test creating products with edge case price values."""
         # Arrange
-        resource_type = "user"
-        user_data = {"id": 1, "name": "", "email": ""}
+        resource_type = "product"
+        product_data = {"id": 1, "name": "Test Product", "price": price_input}
 
         # Act
-        result = create_resource(resource_type, **user_data)
+        result = create_resource(resource_type, **product_data)
 
         # Assert
-        assert result["id"] == 1
-        assert result["name"] == ""
-        assert result["email"] == ""
-
-    def test_user_balance_edge_cases(self):
-        """Test creating users with edge case balance values."""
-        test_cases = [
-            (0.0, 0.0),  # Zero balance
-            (-100.0, -100.0),  # Negative balance
-            (999999.99, 999999.99),  # Large positive balance
-            (0.001, 0.001),  # Very small balance
-        ]
-
-        for balance_input, expected_balance in test_cases:
-            with self.subTest(balance=balance_input):
-                # Arrange
-                resource_type = "user"
-                user_data = {
-                    "id": 1,
-                    "name": "Test User",
-                    "email": "test@example.com",
-                    "balance": balance_input,
-                }
-
-                # Act
-                result = create_resource(resource_type, **user_data)
-
-                # Assert
-                assert result["balance"] == expected_balance
-
-    def test_product_price_edge_cases(self):
-        """Test creating products with edge case price values."""
-        test_cases = [
-            (0.0, 0.0),  # Zero price
-            (-50.0, -50.0),  # Negative price
-            (1000000.0, 1000000.0),  # Large price
-            (0.01, 0.01),  # Small price
-        ]
-
-        for price_input, expected_price in test_cases:
-            with self.subTest(price=price_input):
-                # Arrange
-                resource_type = "product"
-                product_data = {"id": 1, "name": "Test Product", "price": price_input}
-
-                # Act
-                result = create_resource(resource_type, **product_data)
-
-                # Assert
-                assert result["price"] == expected_price
+        assert result["price"] == expected_price
@@ -1,5 +1,8 @@
 import json
+import sys
+from collections import OrderedDict, defaultdict
 from datetime import datetime
+from enum import IntEnum
 from typing import Any, Dict, List
 
 import pytest
@@ -9,6 +12,12 @@ from data.raw.simple.simple3 import DataProcessingError, deep_copy_dict
 # from advanced_functions import DataProcessingError, deep_copy_dict
 
 
+@pytest.fixture(scope="module")
+def large_dict():
+    """1000 string entries, built once; deep_copy_dict only reads its input"""
+    return {f"key_{i}": f"value_{i}" for i in range(1000)}
+
+
 class TestDeepCopyDict:
     """Test cases for the deep_copy_dict function"""
 
@@ -68,7 +77,7 @@ class TestDeepCopyDict:
             "boolean": True,
             "none": None,
             "list": [1, "two", 3.0],
-            "tuple": (1, 2, 3),  # tuples become lists after JSON round-trip
+            "tuple": (1, 2, 3),
             "empty_dict": {},
             "empty_list": [],
         }
@@ -76,8 +85,8 @@ class TestDeepCopyDict:
 
         # Verify all data types are properly copied
         assert copied == original
-        # Note: tuples become lists due to JSON serialization
-        assert isinstance(copied["tuple"], list)
+        # Tuples keep their type
+        assert isinstance(copied["tuple"], tuple)
 
     def test_empty_dict(self):
         """Test copying an empty dictionary"""
@@ -103,14 +112,13 @@ class TestDeepCopyDict:
         assert "\n" in copied["special_chars"]
         assert "\t" in copied["special_chars"]
 
-    def test_large_dict_performance(self):
+    def test_large_dict_performance(self, large_dict):
         """Test copying a large dictionary (basic performance check)"""
-        original = {f"key_{i}": f"value_{i}" for i in range(1000)}
-        copied = deep_copy_dict(original)
+        copied = deep_copy_dict(large_dict)
 
         assert len(copied) == 1000
-        assert copied == original
-        assert copied is not original
+        assert copied == large_dict
+        assert copied is not large_dict
 
     def test_circular_reference_error(self):
         """Test that circular references raise appropriate error"""
@@ -121,7 +129,44 @@ class TestDeepCopyDict:
             deep_copy_dict(original)
 
         assert "Cannot deep copy object" in str(exc_info.value)
-        # JSON can't serialize circular references, so this should fail
+        # Circular references recurse without bound, so this should fail
+
+    def test_deeply_nested_acyclic_error(self):
+        """Test that nesting beyond the recursion limit is not reported as a cycle"""
+        original = leaf = {}
+        for _ in range(sys.getrecursionlimit() + 100):
+            leaf["next"] = {}
+            leaf = leaf["next"]
+
+        with pytest.raises(DataProcessingError, match="too deeply nested or circular"):
+            deep_copy_dict(original)
+
+    @pytest.mark.parametrize(
+        "original",
+        [
+            pytest.param(OrderedDict(a=1, b={"c": [2]}), id="ordered_dict"),
+            pytest.param(defaultdict(list, a=1, b={"c": [2]}), id="defaultdict"),
+        ],
+    )
+    def test_dict_subclass_copied_as_dict(self, original):
+        """Test that dict subclasses are deep copied into plain dicts"""
+        copied = deep_copy_dict(original)
+
+        assert type(copied) is dict
+        assert copied == {"a": 1, "b": {"c": [2]}}
+        assert copied["b"] is not original["b"]
+
+    def test_scalar_subclasses_preserved(self):
+        """Test that int/str subclasses such as IntEnum and bool are accepted"""
+
+        class Level(IntEnum):
+            LOW = 1
+
+        original = {"level": Level.LOW, "flag": True, "items": [Level.LOW]}
+        copied = deep_copy_dict(original)
+
+        assert copied == {"level": 1, "flag": True, "items": [1]}
+        assert copied["items"][0] is Level.LOW
 
     def test_non_serializable_object_error(self):
         """Test error handling for non-serializable objects"""
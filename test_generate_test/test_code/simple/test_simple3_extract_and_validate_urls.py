@@ -163,13 +163,14 @@ class TestExtractAndValidateUrls:
         urls = [base_url.format(i) for i in range(100)]
         text = " ".join(urls)
 
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         result = extract_and_validate_urls(text)
-        end_time = time.time()
+        elapsed_ns = time.perf_counter_ns() - start_ns
 
         assert len(result) == 100
-        # Should complete in reasonable time (less than 1 second)
-        assert end_time - start_time < 1.0
+        # Should complete in reasonable time (less than 1 second); perf_counter
+        # is monotonic and high-resolution, unlike the wall clock
+        assert elapsed_ns < 1_000_000_000
 
     def test_protocol_detection_accuracy(self):
         """Test that protocol detection is accurate"""
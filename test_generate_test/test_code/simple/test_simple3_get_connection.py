@@ -11,10 +11,10 @@ from data.raw.simple.simple3 import SingletonDatabase
 class TestGetConnection:
     """Test cases for the get_connection method of SingletonDatabase class."""
 
-    def test_get_connection_returns_string(self):
+    def test_get_connection_returns_string(self, shared_singleton):
         """Test that get_connection returns a string connection identifier."""
         # Arrange
-        db = SingletonDatabase()
+        db = shared_singleton
 
         # Act
         connection = db.get_connection()
@@ -23,10 +23,12 @@ class TestGetConnection:
         assert isinstance(connection, str)
         assert connection.startswith("DBConnection_")
 
-    def test_get_connection_same_instance_returns_same_connection(self):
+    def test_get_connection_same_instance_returns_same_connection(
+        self, shared_singleton
+    ):
         """Test that multiple calls to get_connection on same instance return same connection string."""
         # Arrange
-        db = SingletonDatabase()
+        db = shared_singleton
         first_connection = db.get_connection()
 
         # Act
@@ -50,10 +52,12 @@ class TestGetConnection:
         # Assert
         assert connection1 == connection2 == connection3
 
-    def test_get_connection_after_close_still_returns_connection(self):
+    def test_get_connection_after_close_still_returns_connection(
+        self, shared_singleton
+    ):
         """Test that get_connection still works after calling close method."""
         # Arrange
-        db = SingletonDatabase()
+        db = shared_singleton
         original_connection = db.get_connection()
 
         # Act
@@ -86,10 +90,10 @@ class TestGetConnection:
         assert len(results) == 5
         assert all(conn == results[0] for conn in results)
 
-    def test_get_connection_format_consistent(self):
+    def test_get_connection_format_consistent(self, shared_singleton):
         """Test that the connection string format is consistent across calls."""
         # Arrange
-        db = SingletonDatabase()
+        db = shared_singleton
 
         # Act
         connection = db.get_connection()
@@ -110,10 +114,10 @@ class TestGetConnection:
         assert len(set(connections)) == 1  # All should be identical
         assert connections[0] == connections[1] == connections[2]
 
-    def test_get_connection_persistence(self):
+    def test_get_connection_persistence(self, shared_singleton):
         """Test that connection string persists across multiple instance creations."""
         # Arrange
-        db1 = SingletonDatabase()
+        db1 = shared_singleton
         original_connection = db1.get_connection()
 
         # Act - Create new instances and verify connection remains the same
@@ -124,10 +128,10 @@ class TestGetConnection:
         assert db2.get_connection() == original_connection
         assert db3.get_connection() == original_connection
 
-    def test_get_connection_not_none(self):
+    def test_get_connection_not_none(self, shared_singleton):
         """Test that get_connection never returns None."""
         # Arrange
-        db = SingletonDatabase()
+        db = shared_singleton
 
         # Act
         connection = db.get_connection()
@@ -136,10 +140,10 @@ class TestGetConnection:
         assert connection is not None
         assert connection != ""
 
-    def test_get_connection_immutable(self):
+    def test_get_connection_immutable(self, shared_singleton):
         """Test that the returned connection string cannot be modified to affect other instances."""
         # Arrange
-        db1 = SingletonDatabase()
+        db1 = shared_singleton
         db2 = SingletonDatabase()
 
         # Act
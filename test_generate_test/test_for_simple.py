@@ -152,7 +152,24 @@ def run_tests(test_dir):
         return "No tests to run."
 
     report_path = os.path.join(os.path.dirname(test_dir), "simple_test_report.html")
-    command = ["pytest", test_dir, f"--html={report_path}"]
+    # 生成的测试模块彼此独立，使用 pytest-xdist 并行执行；
+    # loadfile 保证同一模块的测试落在同一 worker 上，避免 patch 之间互相干扰
+    command = [
+        "pytest",
+        test_dir,
+        "-n",
+        "auto",
+        "--dist=loadfile",
+        # 冒烟测试无需缓存 I/O 和 app 覆盖率统计
+        "-p",
+        "no:cacheprovider",
+        "--no-cov",
+        # 覆盖 pytest.ini 中的 -v/-l：只保留简短回溯，不逐帧格式化局部变量
+        "-q",
+        "--no-header",
+        "--tb=short",
+        f"--html={report_path}",
+    ]
 
     print(f"使用命令运行测试: {' '.join(command)}")
 